@@ -0,0 +1,117 @@
+"""Moduł zawiera menedżer obrazków gry, ładujący je z dysku tylko raz na cały proces.
+
+Obrazki stanów wisielca są konwertowane do formatu ekranu, więc ich rysowanie nie wymaga konwersji pikseli przy
+każdej klatce. Opcjonalnie wszystkie stany mogą zostać spakowane do jednego atlasu (sprite sheet).
+
+Attributes:
+    IMG_DIR (str): Katalog z obrazkami gry.
+    STAGE_COUNT (int): Liczba obrazków ze stanami wisielca.
+    ATLAS_COLUMNS (int): Liczba kolumn w atlasie ze stanami wisielca.
+
+"""
+import pygame
+
+IMG_DIR = "img"
+STAGE_COUNT = 11
+ATLAS_COLUMNS = 4
+
+_stages: dict[bool, list[pygame.Surface]] = {}
+_icon: pygame.Surface | None = None
+
+
+def load_image(name: str) -> pygame.Surface:
+    """Wczytuje obrazek z katalogu z obrazkami gry.
+
+    Args:
+        name: Nazwa pliku z obrazkiem.
+
+    Returns:
+        Wczytany, nieskonwertowany obrazek.
+
+    """
+    return pygame.image.load(f"{IMG_DIR}/{name}")
+
+
+def convert_image(image: pygame.Surface) -> pygame.Surface:
+    """Konwertuje obrazek do formatu ekranu, zachowując przezroczystość, jeżeli obrazek ją ma.
+
+    Args:
+        image: Obrazek do skonwertowania.
+
+    Returns:
+        Skonwertowany obrazek.
+
+    """
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+    return image.convert()
+
+
+def build_atlas(images: list[pygame.Surface]) -> list[pygame.Surface]:
+    """Pakuje obrazki do jednego atlasu i zwraca je jako jego podpowierzchnie.
+
+    Args:
+        images: Obrazki do spakowania.
+
+    Returns:
+        Lista podpowierzchni atlasu, w tej samej kolejności co obrazki.
+
+    """
+    cell_width = max(image.get_width() for image in images)
+    cell_height = max(image.get_height() for image in images)
+    columns = min(ATLAS_COLUMNS, len(images))
+    rows = (len(images) + columns - 1) // columns
+
+    atlas = pygame.Surface((columns * cell_width, rows * cell_height), pygame.SRCALPHA)
+    rects = []
+    for i, image in enumerate(images):
+        rect = image.get_rect(topleft=((i % columns) * cell_width, (i // columns) * cell_height))
+        atlas.blit(image, rect)
+        rects.append(rect)
+
+    atlas = atlas.convert_alpha()
+    return [atlas.subsurface(rect) for rect in rects]
+
+
+def get_stages(use_atlas: bool = False) -> list[pygame.Surface]:
+    """Zwraca obrazki ze stanami wisielca, wczytując je i konwertując tylko przy pierwszym wywołaniu dla danego
+    use_atlas (wersje z atlasem i bez niego są przechowywane osobno, więc można je porównać w jednym procesie).
+
+    Funkcja musi zostać wywołana po pygame.display.set_mode(), ponieważ konwersja wymaga znajomości formatu ekranu.
+
+    Args:
+        use_atlas: Prawda, jeżeli obrazki mają zostać spakowane do jednego atlasu.
+
+    Returns:
+        Lista obrazków ze stanami wisielca 0 - 10.
+
+    """
+    stages = _stages.get(use_atlas)
+    if stages is None:
+        images = [load_image(f"{i}.png") for i in range(STAGE_COUNT)]
+        if use_atlas:
+            stages = build_atlas(images)
+        else:
+            stages = [convert_image(image) for image in images]
+        _stages[use_atlas] = stages
+    return stages
+
+
+def get_icon() -> pygame.Surface:
+    """Zwraca ikonę okna gry, wczytując ją tylko przy pierwszym wywołaniu.
+
+    Returns:
+        Ikona okna gry.
+
+    """
+    global _icon
+    if _icon is None:
+        _icon = load_image("icon.png")
+    return _icon
+
+
+def clear_cache() -> None:
+    """Usuwa z pamięci wczytane obrazki, np. po zmianie trybu ekranu."""
+    global _icon
+    _stages.clear()
+    _icon = None
@@ -0,0 +1,303 @@
+"""Moduł zawiera usługę uwierzytelniania graczy, wykonującą kosztowne operacje bcrypt w puli wątków.
+
+bcrypt zwalnia GIL na czas liczenia hasha, więc pula wątków pozwala obsługiwać wiele logowań równolegle, nie
+blokując ani pętli Tk, ani pętli asyncio. Koszt bcrypt można zmienić zmienną środowiskową WISIELEC_BCRYPT_ROUNDS -
+hasła z innym kosztem są przeliczane przy najbliższym udanym logowaniu. Moduł bcrypt jest importowany dopiero przy
+pierwszym hashowaniu lub sprawdzeniu hasła.
+
+Identyfikatory nowych graczy nadaje baza danych, a powtórzone pseudonimy odrzuca unikalny indeks kolumny Nickname.
+Listę graczy można zarejestrować w jednej transakcji z linii poleceń (plik CSV z kolumnami "nickname"
+i "password")::
+
+    python auth.py gracze.csv
+
+Attributes:
+    BCRYPT_ROUNDS (int): Koszt (log2 liczby rund) bcrypt dla nowych haseł.
+    AUTH_WORKERS (int): Liczba wątków puli uwierzytelniania.
+    NICKNAME_QUERY_SIZE (int): Liczba pseudonimów sprawdzanych jednym zapytaniem przy rejestracji wielu graczy.
+    auth_service (AuthService): Współdzielona w procesie usługa uwierzytelniania.
+
+"""
+import argparse
+import asyncio
+import csv
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from database import Session
+from db_initialize import Player
+
+BCRYPT_ROUNDS = int(os.environ.get("WISIELEC_BCRYPT_ROUNDS", "12"))
+AUTH_WORKERS = min(8, os.cpu_count() or 1)
+NICKNAME_QUERY_SIZE = 500
+
+
+class RegistrationResult(NamedTuple):
+    """Wynik rejestracji wielu graczy.
+
+    Attributes:
+        inserted (int): Liczba zarejestrowanych graczy.
+        skipped (list[str]): Pominięte pseudonimy - zajęte w bazie danych lub powtórzone na liście.
+        seconds (float): Czas trwania rejestracji w sekundach.
+
+    """
+    inserted: int
+    skipped: list[str]
+    seconds: float
+
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Funkcja hashuje hasło.
+
+    Args:
+        password: Hasło do shashowania.
+        rounds: Koszt bcrypt.
+
+    Returns:
+        Shashowane hasło.
+
+    """
+    import bcrypt
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    """Sprawdza czy zwykłe hasło zgadza się z tym shashowanym.
+
+    Args:
+        password: Zwykłe hasło.
+        hashed_password: Shashowane hasło.
+
+    Returns:
+        Prawda, jeżeli hasła się zgadzają. Fałsz w przeciwnym przypadku
+
+    """
+    import bcrypt
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def get_rounds(hashed_password: str) -> int:
+    """Odczytuje koszt bcrypt z shashowanego hasła (format $2b$<koszt>$...).
+
+    Args:
+        hashed_password: Shashowane hasło.
+
+    Returns:
+        Koszt bcrypt.
+
+    """
+    return int(hashed_password.split("$")[2])
+
+
+class AuthService:
+    """Klasa reprezentuje usługę uwierzytelniania, wykonującą hashowanie i weryfikację haseł w puli wątków.
+
+    Metody zwracają concurrent.futures.Future; metody z przyrostkiem _async można wywoływać w pętli asyncio.
+
+    Args:
+        rounds: Koszt bcrypt dla nowych i przeliczanych haseł.
+        workers: Liczba wątków puli.
+
+    Attributes:
+        rounds (int): Koszt bcrypt dla nowych i przeliczanych haseł.
+        executor (concurrent.futures.ThreadPoolExecutor): Pula wątków.
+
+    """
+
+    def __init__(self, rounds: int = BCRYPT_ROUNDS, workers: int = AUTH_WORKERS) -> None:
+        self.rounds = rounds
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="auth")
+
+    def hash_password(self, password: str) -> Future:
+        """Hashuje hasło w puli wątków.
+
+        Args:
+            password: Hasło do shashowania.
+
+        Returns:
+            Future z shashowanym hasłem.
+
+        """
+        return self.executor.submit(hash_password, password, self.rounds)
+
+    def verify_password(self, password: str, hashed_password: str) -> Future:
+        """Sprawdza hasło w puli wątków.
+
+        Args:
+            password: Zwykłe hasło.
+            hashed_password: Shashowane hasło.
+
+        Returns:
+            Future z wynikiem sprawdzenia.
+
+        """
+        return self.executor.submit(verify_password, password, hashed_password)
+
+    def login(self, nickname: str, password: str) -> Future:
+        """Loguje gracza w puli wątków.
+
+        Args:
+            nickname: Pseudonim gracza.
+            password: Hasło gracza.
+
+        Returns:
+            Future z graczem albo None, jeżeli dane są błędne.
+
+        """
+        return self.executor.submit(self.authenticate, nickname, password)
+
+    def register(self, nickname: str, password: str) -> Future:
+        """Rejestruje gracza w puli wątków.
+
+        Args:
+            nickname: Pseudonim gracza.
+            password: Hasło gracza.
+
+        Returns:
+            Future z zarejestrowanym graczem albo None, jeżeli pseudonim jest zajęty.
+
+        """
+        return self.executor.submit(self.create_player, nickname, password)
+
+    async def hash_password_async(self, password: str) -> str:
+        """Wersja hash_password dla asyncio."""
+        return await asyncio.wrap_future(self.hash_password(password))
+
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """Wersja verify_password dla asyncio."""
+        return await asyncio.wrap_future(self.verify_password(password, hashed_password))
+
+    async def login_async(self, nickname: str, password: str) -> Player | None:
+        """Wersja login dla asyncio."""
+        return await asyncio.wrap_future(self.login(nickname, password))
+
+    async def register_async(self, nickname: str, password: str) -> Player | None:
+        """Wersja register dla asyncio."""
+        return await asyncio.wrap_future(self.register(nickname, password))
+
+    def create_player(self, nickname: str, password: str) -> Player | None:
+        """Hashuje hasło i dodaje gracza do bazy danych z identyfikatorem nadanym przez bazę.
+
+        Metoda blokuje wątek - należy ją wywoływać w puli (register, register_async).
+
+        Args:
+            nickname: Pseudonim gracza.
+            password: Hasło gracza.
+
+        Returns:
+            Zarejestrowany gracz albo None, jeżeli pseudonim jest zajęty.
+
+        """
+        session = Session()
+        try:
+            player = Player(None, nickname, hash_password(password, self.rounds))
+            session.add(player)
+            session.commit()
+            return player
+        except IntegrityError:
+            session.rollback()
+            return None
+        finally:
+            Session.remove()
+
+    def register_many(self, players: Iterable[tuple[str, str]]) -> RegistrationResult:
+        """Rejestruje wielu graczy - hasła są hashowane równolegle w puli, a gracze wstawiani w jednej transakcji.
+
+        Pseudonimy zajęte w bazie danych lub powtórzone na liście są pomijane. Metoda blokuje wywołujący wątek
+        i nie może być wywoływana z wątku puli.
+
+        Args:
+            players: Pary (pseudonim, hasło).
+
+        Returns:
+            Wynik rejestracji.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: Jeżeli w trakcie rejestracji ktoś inny zajął jeden z pseudonimów - wtedy
+                żaden gracz nie zostaje zarejestrowany.
+
+        """
+        start = time.perf_counter()
+        unique_players = {}
+        skipped = []
+        for nickname, password in players:
+            if nickname in unique_players:
+                skipped.append(nickname)
+            else:
+                unique_players[nickname] = password
+
+        session = Session()
+        try:
+            nicknames = list(unique_players)
+            for i in range(0, len(nicknames), NICKNAME_QUERY_SIZE):
+                query = select(Player.nickname).where(Player.nickname.in_(nicknames[i:i + NICKNAME_QUERY_SIZE]))
+                for nickname in session.scalars(query):
+                    del unique_players[nickname]
+                    skipped.append(nickname)
+
+            hashed_passwords = self.executor.map(hash_password, unique_players.values(),
+                                                 [self.rounds] * len(unique_players))
+            rows = [{"nickname": nickname, "password": hashed_password, "best_score": 0}
+                    for nickname, hashed_password in zip(unique_players, hashed_passwords)]
+            if rows:
+                session.execute(insert(Player), rows)
+            session.commit()
+        finally:
+            Session.remove()
+        return RegistrationResult(len(rows), skipped, time.perf_counter() - start)
+
+    def authenticate(self, nickname: str, password: str) -> Player | None:
+        """Sprawdza dane logowania gracza i przelicza jego hasło, jeżeli zostało shashowane z innym kosztem.
+
+        Metoda blokuje wątek - należy ją wywoływać w puli (login, login_async).
+
+        Args:
+            nickname: Pseudonim gracza.
+            password: Hasło gracza.
+
+        Returns:
+            Gracz, jeżeli dane są poprawne, w przeciwnym razie None.
+
+        """
+        session = Session()
+        try:
+            player = session.query(Player).filter_by(nickname=nickname).first()
+            if player is None or not verify_password(password, player.password):
+                return None
+            if get_rounds(player.password) != self.rounds:
+                player.password = hash_password(password, self.rounds)
+                session.commit()
+            return player
+        finally:
+            Session.remove()
+
+    def shutdown(self) -> None:
+        """Czeka na zakończenie rozpoczętych operacji i zamyka pulę wątków."""
+        self.executor.shutdown()
+
+
+auth_service = AuthService()
+
+
+def main() -> None:
+    """Rejestruje graczy z pliku CSV z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Rejestracja listy graczy wisielca.")
+    parser.add_argument("path", help="Plik CSV z kolumnami nickname i password.")
+    args = parser.parse_args()
+
+    with open(args.path, newline="", encoding="utf-8") as file:
+        players = [(row["nickname"].strip(), row["password"]) for row in csv.DictReader(file)]
+    result = auth_service.register_many(players)
+    auth_service.shutdown()
+    print(f"Zarejestrowano {result.inserted} graczy w {result.seconds:.2f} s, pominięto {len(result.skipped)}.")
+    for nickname in result.skipped:
+        print(f"Pominięto: {nickname}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""Moduł zawiera zestaw benchmarków logiki gry, renderowania i ścieżek bazy danych, z wynikami w formacie JSON.
+
+Benchmarki działają bez ekranu (sterownik wideo SDL "dummy") na tymczasowej bazie SQLite, tworzonej od zera przy
+każdym uruchomieniu, więc wyniki z kolejnych uruchomień można porównywać ze sobą. Benchmark okna statystyk wymaga
+ekranu dla Tk - bez niego jest pomijany.
+
+Przykład użycia z linii poleceń::
+
+    python benchmarks.py --output wyniki.json
+    python benchmarks.py --quick
+
+Attributes:
+    WORD_COUNTS (tuple[int, ...]): Domyślne rozmiary słownika dla benchmarku losowania słowa.
+    PLAYER_COUNT (int): Domyślna liczba graczy w bazie dla benchmarku okna statystyk.
+    REPEAT (int): Domyślna liczba powtórzeń mierzonych operacji.
+    AUTH_REPEAT (int): Domyślna liczba mierzonych logowań i rejestracji.
+    BENCHMARK_ROUNDS (int): Domyślny koszt bcrypt w benchmarku logowania i rejestracji.
+    SEED (int): Ziarno generatora liczb losowych.
+
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable
+
+WORD_COUNTS = (1000, 100000, 1000000)
+PLAYER_COUNT = 100000
+REPEAT = 1000
+AUTH_REPEAT = 10
+BENCHMARK_ROUNDS = 12
+SEED = 0
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    """Podsumowuje czasy pojedynczych wywołań.
+
+    Args:
+        timings: Czasy w milisekundach.
+
+    Returns:
+        Liczba wywołań, średnia, minimum oraz p50, p95 i p99 w milisekundach.
+
+    """
+    from profiler import RollingStats
+
+    stats = RollingStats(len(timings))
+    for timing in timings:
+        stats.add(timing)
+    p50, p95, p99 = stats.percentiles(0.5, 0.95, 0.99)
+    return {"runs": len(timings), "mean_ms": stats.total / len(timings), "min_ms": min(timings),
+            "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+
+def time_calls(function: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Mierzy czas kolejnych wywołań funkcji.
+
+    Args:
+        function: Mierzona funkcja bez argumentów.
+        repeat: Liczba wywołań.
+
+    Returns:
+        Podsumowanie czasów wywołań (summarize).
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return summarize(timings)
+
+
+def random_words(count: int, rng: random.Random) -> list[str]:
+    """Generuje losowe słowa z alfabetu gry.
+
+    Args:
+        count: Liczba słów.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Słowa o długości 4 - 12, z wielkiej litery.
+
+    """
+    from game_state import ALPHABET
+
+    return ["".join(rng.choices(ALPHABET, k=rng.randint(4, 12))).capitalize() for _ in range(count)]
+
+
+def bench_game_logic(repeat: int, rng: random.Random) -> dict[str, dict[str, float]]:
+    """Mierzy przepustowość find_indexes oraz check_letter w całych rozgrywkach.
+
+    Args:
+        repeat: Liczba rozgrywek.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Wyniki dla find_indexes i check_letter.
+
+    """
+    from game_state import ALPHABET, GameState, find_indexes
+
+    words = [word.upper() for word in random_words(repeat, rng)]
+    letters = list(ALPHABET)
+
+    start = time.perf_counter()
+    for word in words:
+        for letter in letters:
+            find_indexes(letter, word)
+    find_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for word in words:
+        state = GameState(word)
+        for letter in letters:
+            state.check_letter(letter)
+    check_seconds = time.perf_counter() - start
+
+    calls = len(words) * len(letters)
+    return {
+        "find_indexes": {"calls": calls, "calls_per_second": calls / find_seconds},
+        "check_letter": {"calls": calls, "calls_per_second": calls / check_seconds,
+                         "games_per_second": len(words) / check_seconds},
+    }
+
+
+def bench_rendering(repeat: int) -> dict[str, dict[str, float]]:
+    """Mierzy koszt klatki draw_content (pełne przerysowanie, zmiana jednego przycisku, klatka bez zmian) oraz
+    tworzenia przycisków.
+
+    Args:
+        repeat: Liczba mierzonych klatek każdego rodzaju.
+
+    Returns:
+        Wyniki dla poszczególnych rodzajów klatek, dla konstrukcji Button oraz dla wyznaczania klikniętego przycisku.
+
+    """
+    import pygame
+
+    from auth import hash_password
+    from button import Button
+    from database import Session
+    from db_initialize import Player
+    from game import Game
+
+    session = Session()
+    players = [Player(None, f"bench_render_{i}", hash_password("haslo", 4)) for i in range(2)]
+    session.add_all(players)
+    session.commit()
+
+    game = Game(*players)
+    game.draw_content()
+
+    def full_frame() -> None:
+        game.needs_full_redraw = True
+        game.draw_content()
+
+    def button_frame() -> None:
+        game.mark_dirty(game.buttons[0])
+        game.draw_content()
+
+    results = {
+        "draw_content_full": time_calls(full_frame, repeat),
+        "draw_content_button": time_calls(button_frame, repeat),
+        "draw_content_idle": time_calls(game.draw_content, repeat),
+        "button_construction": time_calls(lambda: Button(0, 0, 50, 50, "A", game.screen), repeat),
+        "button_hit_test": time_calls(lambda: game.button_grid.hit(game.buttons[-1].center), repeat),
+    }
+    pygame.display.quit()
+    Session.remove()
+    return results
+
+
+def insert_words(total: int, rng: random.Random) -> None:
+    """Dopełnia tabelę word losowymi słowami do podanej liczby słów.
+
+    Args:
+        total: Docelowa liczba słów.
+        rng: Generator liczb losowych.
+
+    """
+    import dictionary
+    from database import engine
+    from db_initialize import bump_dictionary_version
+
+    with engine.begin() as connection:
+        count = connection.exec_driver_sql("SELECT COUNT(*) FROM word").scalar()
+        category_ids = [row[0] for row in connection.exec_driver_sql("SELECT id FROM category")]
+        missing = total - count
+        for start in range(0, max(missing, 0), 100000):
+            words = random_words(min(100000, missing - start), rng)
+            connection.exec_driver_sql("INSERT INTO word (word, category_id) VALUES (?, ?)",
+                                       [(word, rng.choice(category_ids)) for word in words])
+        bump_dictionary_version(connection)
+    dictionary.cache.invalidate()
+
+
+def bench_word_picking(word_counts: list[int], repeat: int, rng: random.Random) -> dict[str, dict[str, float]]:
+    """Mierzy opóźnienie Game.pick_category_and_word przy różnych rozmiarach słownika.
+
+    Pierwsze losowanie po zmianie słownika wczytuje słownik do pamięci (cold_ms), kolejne korzystają z pamięci.
+
+    Args:
+        word_counts: Rozmiary słownika, rosnąco.
+        repeat: Liczba mierzonych losowań dla każdego rozmiaru.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Wyniki dla każdego rozmiaru słownika.
+
+    """
+    from game import Game
+
+    results = {}
+    for word_count in sorted(word_counts):
+        insert_words(word_count, rng)
+        start = time.perf_counter()
+        Game.pick_category_and_word()
+        cold_ms = (time.perf_counter() - start) * 1000
+        result = time_calls(Game.pick_category_and_word, repeat)
+        result["cold_ms"] = cold_ms
+        results[str(word_count)] = result
+    return results
+
+
+def bench_auth(repeat: int, rounds: int) -> dict[str, dict[str, float]]:
+    """Mierzy opóźnienie rejestracji i logowania oraz przepustowość równoległych logowań.
+
+    Args:
+        repeat: Liczba mierzonych rejestracji i logowań.
+        rounds: Koszt bcrypt.
+
+    Returns:
+        Wyniki dla rejestracji, logowania i równoległych logowań.
+
+    """
+    from auth import AUTH_WORKERS, AuthService
+
+    service = AuthService(rounds=rounds)
+    nicknames = iter(f"bench_auth_{i}" for i in range(repeat))
+    register = time_calls(lambda: service.register(next(nicknames), "haslo").result(), repeat)
+    login = time_calls(lambda: service.login("bench_auth_0", "haslo").result(), repeat)
+
+    logins = repeat * AUTH_WORKERS
+    start = time.perf_counter()
+    for future in [service.login("bench_auth_0", "haslo") for _ in range(logins)]:
+        future.result()
+    seconds = time.perf_counter() - start
+    service.shutdown()
+    return {
+        "register": register,
+        "login": login,
+        "concurrent_login": {"logins": logins, "logins_per_second": logins / seconds},
+    }
+
+
+def bench_stats_window(player_count: int, rng: random.Random) -> dict[str, float | str]:
+    """Mierzy czas otwarcia okna statystyk przy dużej liczbie graczy.
+
+    Args:
+        player_count: Liczba graczy w bazie danych.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Czas otwarcia okna w milisekundach albo powód pominięcia benchmarku.
+
+    """
+    import tkinter as tk
+
+    from database import engine
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as error:
+        return {"skipped": f"Brak ekranu dla Tk: {error}"}
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql('INSERT INTO "Player" ("Nickname", "Password", "BestScore") VALUES (?, ?, ?)',
+                                   [(f"bench_stats_{i}", "-", rng.randint(0, 1000)) for i in range(player_count)])
+
+    from windows import StatsWindow
+
+    start = time.perf_counter()
+    window = StatsWindow()
+    window.update()
+    open_ms = (time.perf_counter() - start) * 1000
+    window.destroy()
+    return {"players": player_count, "open_ms": open_ms}
+
+
+def run_benchmarks(word_counts: list[int], player_count: int, repeat: int, auth_repeat: int,
+                   rounds: int, seed: int = SEED) -> dict:
+    """Uruchamia wszystkie benchmarki na świeżej bazie danych.
+
+    Baza danych musi być już wskazana przez WISIELEC_DATABASE_URL (robi to main).
+
+    Args:
+        word_counts: Rozmiary słownika dla benchmarku losowania słowa.
+        player_count: Liczba graczy dla benchmarku okna statystyk.
+        repeat: Liczba powtórzeń szybkich operacji.
+        auth_repeat: Liczba mierzonych logowań i rejestracji.
+        rounds: Koszt bcrypt.
+        seed: Ziarno generatora liczb losowych.
+
+    Returns:
+        Metadane uruchomienia oraz wyniki wszystkich benchmarków.
+
+    """
+    import pygame
+    import sqlalchemy
+
+    import db_initialize
+
+    rng = random.Random(seed)
+    db_initialize.db_initialize()
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "pygame": pygame.version.ver,
+            "sqlalchemy": sqlalchemy.__version__,
+            "seed": seed,
+            "bcrypt_rounds": rounds,
+        },
+        "results": {
+            "game_logic": bench_game_logic(repeat, rng),
+            "rendering": bench_rendering(repeat),
+            "word_picking": bench_word_picking(word_counts, repeat, rng),
+            "auth": bench_auth(auth_repeat, rounds),
+            "stats_window": bench_stats_window(player_count, rng),
+        },
+    }
+
+
+def main() -> None:
+    """Uruchamia benchmarki z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Benchmarki wisielca.")
+    parser.add_argument("--output", help="Plik JSON z wynikami. Domyślnie wyniki są wypisywane na ekran.")
+    parser.add_argument("--word-counts", type=int, nargs="+", default=list(WORD_COUNTS),
+                        help="Rozmiary słownika dla benchmarku losowania słowa.")
+    parser.add_argument("--players", type=int, default=PLAYER_COUNT, help="Liczba graczy dla okna statystyk.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Liczba powtórzeń szybkich operacji.")
+    parser.add_argument("--auth-repeat", type=int, default=AUTH_REPEAT, help="Liczba logowań i rejestracji.")
+    parser.add_argument("--rounds", type=int, default=BENCHMARK_ROUNDS, help="Koszt bcrypt.")
+    parser.add_argument("--quick", action="store_true", help="Mniejsze rozmiary danych i niższy koszt bcrypt.")
+    args = parser.parse_args()
+    if args.quick:
+        args.word_counts, args.players, args.repeat, args.auth_repeat, args.rounds = [1000, 10000], 1000, 100, 3, 4
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["WISIELEC_DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        results = run_benchmarks(args.word_counts, args.players, args.repeat, args.auth_repeat, args.rounds)
+        from database import engine
+        engine.dispose()
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
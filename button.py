@@ -1,8 +1,19 @@
-"""Muduł zawierający klasę Button."""
-import tkinter.font
+"""Muduł zawierający klasę Button oraz indeks przycisków ButtonGrid.
+
+Attributes:
+    BUTTON_FONT_SIZE (int): Rozmiar czcionki liter na przyciskach.
+    DEFAULT_CELL_SIZE (int): Rozmiar komórki ButtonGrid, jeżeli nie podano go i nie ma przycisków.
+
+"""
+from typing import Iterable, Iterator
 
 import pygame
 
+from fonts import get_font, render_text
+
+BUTTON_FONT_SIZE = 35
+DEFAULT_CELL_SIZE = 50
+
 
 class Button(pygame.Rect):
     """Klasa reprezentuje przycisk z literą. Dziedziczy po klacie pygame.Rect().
@@ -20,7 +31,7 @@ class Button(pygame.Rect):
         surface (pygame.Surface): Powierzchnia, na której przycisk ma być rysowany.
         is_visible (bool): Prawda, jeżeli przycisk ma być widoczny i ma działać w aplikacji.
         color_rgb (tuple[int, int, int]): Kolor w formacie RGB.
-        font (tkinter.font.Font): Czcionka użyta przy renderowaniu litery.
+        font (pygame.font.Font): Czcionka użyta przy renderowaniu litery.
         letter_surface (pygame.Surface): Powierzchnia, na której renderowana jest litera.
         letter_rect (pygame.Rect): Prostokąt, na któym renderowana jest litera.
 
@@ -33,8 +44,8 @@ class Button(pygame.Rect):
         self.surface = surface
         self.is_visible = True
         self.color_rgb = (100, 161, 139)
-        self.font = pygame.font.SysFont("Comic sans MS", 35)
-        self.letter_surface = self.font.render(letter, True, "black")
+        self.font = get_font(BUTTON_FONT_SIZE)
+        self.letter_surface = render_text(letter, BUTTON_FONT_SIZE)
         self.letter_rect = self.letter_surface.get_rect(center=self.center)
 
     def draw(self) -> None:
@@ -42,3 +53,93 @@ class Button(pygame.Rect):
         if self.is_visible:
             pygame.draw.rect(self.surface, self.color_rgb, self)
             self.surface.blit(self.letter_surface, self.letter_rect)
+
+
+class ButtonGrid:
+    """Klasa reprezentuje indeks przycisków do sprawdzania, który przycisk został kliknięty.
+
+    Ekran jest podzielony na kwadratowe komórki, a każdy przycisk jest zapisany w komórkach, na które zachodzi.
+    Kliknięcie sprawdza tylko przyciski z komórki, w którą trafiło, więc czas nie zależy od liczby przycisków,
+    a układ przycisków (alfabet, kilka plansz) może być dowolny.
+
+    Args:
+        buttons: Przyciski, które mają być w indeksie.
+        cell_size: Bok komórki w pikselach. Domyślnie największy wymiar przycisku, więc przycisk zajmuje najwyżej
+            cztery komórki.
+
+    Attributes:
+        cell_size (int): Bok komórki w pikselach.
+        buttons (list[Button]): Wszystkie przyciski w indeksie.
+        cells (dict[tuple[int, int], list[Button]]): Przyciski w podziale na komórki.
+
+    """
+
+    def __init__(self, buttons: Iterable[Button] = (), cell_size: int | None = None) -> None:
+        buttons = list(buttons)
+        if cell_size is None:
+            cell_size = max((max(button.width, button.height) for button in buttons), default=DEFAULT_CELL_SIZE)
+        self.cell_size = max(cell_size, 1)
+        self.buttons = []
+        self.cells = {}
+        for button in buttons:
+            self.add(button)
+
+    def __iter__(self) -> Iterator[Button]:
+        return iter(self.buttons)
+
+    def __len__(self) -> int:
+        return len(self.buttons)
+
+    def _cells_of(self, rect: pygame.Rect) -> Iterator[tuple[int, int]]:
+        """Wyznacza komórki, na które zachodzi prostokąt.
+
+        Args:
+            rect: Prostokąt.
+
+        Yields:
+            Współrzędne komórki.
+
+        """
+        for column in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+            for row in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1):
+                yield column, row
+
+    def add(self, button: Button) -> None:
+        """Dodaje przycisk do indeksu.
+
+        Args:
+            button: Przycisk.
+
+        """
+        self.buttons.append(button)
+        for cell in self._cells_of(button):
+            self.cells.setdefault(cell, []).append(button)
+
+    def remove(self, button: Button) -> None:
+        """Usuwa przycisk z indeksu.
+
+        Args:
+            button: Przycisk.
+
+        """
+        self.buttons.remove(button)
+        for cell in self._cells_of(button):
+            self.cells[cell].remove(button)
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def hit(self, pos: tuple[int, int]) -> Button | None:
+        """Wyznacza widoczny przycisk w podanym punkcie.
+
+        Args:
+            pos: Współrzędne punktu, np. event.pos.
+
+        Returns:
+            Pierwszy dodany widoczny przycisk zawierający punkt albo None, jeżeli takiego nie ma.
+
+        """
+        x, y = pos
+        for button in self.cells.get((x // self.cell_size, y // self.cell_size), ()):
+            if button.is_visible and button.collidepoint(pos):
+                return button
+        return None
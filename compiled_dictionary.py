@@ -0,0 +1,429 @@
+"""Moduł zawiera skompilowany, binarny format słownika, otwierany przez mmap.
+
+Plik jest budowany z tabel word i category. Słowa nie są zamieniane na obiekty Pythona przy otwarciu - tablice są
+widokami (memoryview.cast, numpy.frombuffer) na zmapowany plik, a napis powstaje dopiero przy odczycie konkretnego
+słowa. Kilka procesów otwierających ten sam plik współdzieli jedną kopię w pamięci podręcznej systemu.
+
+Plik zawiera też maski bitowe dla podpowiedzi (solver.CompiledWordIndex): słowa są pogrupowane według długości,
+a w każdej grupie dla każdej pary (pozycja, litera) zapisana jest maska słów, które mają tę literę na tej pozycji.
+
+Układ pliku (liczby little-endian, sekcje wyrównane do 8 bajtów)::
+
+    nagłówek        HEADER_FORMAT: magia, wersja formatu, liczba słów, liczba kategorii, wersja słownika,
+                    przesunięcie indeksu długości
+    kategorie       CATEGORY_FORMAT dla każdej kategorii: id, pierwsze słowo, koniec słów z trudnością, koniec słów,
+                    przesunięcie i długość nazwy w bloku tekstu
+    trudności       float64 dla każdego słowa (NaN - brak)
+    id słów         uint32 dla każdego słowa
+    przesunięcia    uint32 dla każdego słowa i jedno na końcu - granice słów w bloku tekstu
+    blok tekstu     słowa, a po nich nazwy kategorii, w UTF-8
+    indeks długości INDEX_FORMAT: liczba grup i długość alfabetu w bajtach, alfabet w UTF-8, GROUP_FORMAT dla
+                    każdej grupy: długość słów, liczba słów, przesunięcie danych grupy
+    dane grupy      uint32 indeksy słów grupy (rosnąco), maski pozycji (długość x litera alfabetu) i maski liter
+                    (litera alfabetu) - każda maska to (liczba słów + 7) // 8 bajtów, bit i odpowiada i-temu słowu grupy
+
+Słowa są pogrupowane według kategorii, a w kategorii posortowane według trudności (słowa bez trudności na końcu).
+
+Przykład użycia z linii poleceń::
+
+    python compiled_dictionary.py build slownik.wdict
+    python compiled_dictionary.py info slownik.wdict
+
+Attributes:
+    MAGIC (bytes): Początek każdego pliku skompilowanego słownika.
+    FORMAT_VERSION (int): Wersja formatu pliku.
+    HEADER_FORMAT (str): Format nagłówka dla modułu struct.
+    CATEGORY_FORMAT (str): Format wpisu kategorii dla modułu struct.
+    INDEX_FORMAT (str): Format początku indeksu długości dla modułu struct.
+    GROUP_FORMAT (str): Format wpisu grupy słów jednej długości dla modułu struct.
+
+"""
+import argparse
+import math
+import mmap
+import os
+import random
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterator, NamedTuple
+
+import numpy as np
+from sqlalchemy import select
+
+from database import engine
+from db_initialize import Category, Word, db_initialize, get_dictionary_version
+from game_state import ALPHABET
+from word_picker import PickedWord
+
+MAGIC = b"WSLC"
+FORMAT_VERSION = 2
+HEADER_FORMAT = "<4sIIIIQ"
+CATEGORY_FORMAT = "<IIIIII"
+INDEX_FORMAT = "<II"
+GROUP_FORMAT = "<IIQ"
+
+
+class CategoryRange(NamedTuple):
+    """Zakres słów jednej kategorii w skompilowanym słowniku.
+
+    Attributes:
+        name (str): Nazwa kategorii.
+        start (int): Indeks pierwszego słowa kategorii.
+        scored_end (int): Indeks za ostatnim słowem z wyliczoną trudnością.
+        end (int): Indeks za ostatnim słowem kategorii.
+
+    """
+    name: str
+    start: int
+    scored_end: int
+    end: int
+
+
+class LengthGroup(NamedTuple):
+    """Maski bitowe słów jednej długości - widoki na zmapowany plik.
+
+    Attributes:
+        length (int): Długość słów (pisanych wielkimi literami).
+        indices (numpy.ndarray): Indeksy słów grupy w słowniku (uint32, rosnąco).
+        positions (numpy.ndarray): Maski słów mających daną literę na danej pozycji (uint8), o kształcie
+            (length, len(ALPHABET), bajty maski).
+        letters (numpy.ndarray): Maski słów zawierających daną literę (uint8), o kształcie (len(ALPHABET), bajty maski).
+
+    """
+    length: int
+    indices: np.ndarray
+    positions: np.ndarray
+    letters: np.ndarray
+
+
+def build_length_groups(words: list[str]) -> list[tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """Wylicza maski bitowe słów w podziale na długość, tak jak solver.LengthBucket.
+
+    Args:
+        words: Słowa w kolejności indeksów w słowniku.
+
+    Returns:
+        Dla każdej długości: długość, indeksy słów, maski pozycji i maski liter (zob. LengthGroup).
+
+    """
+    grouped = {}
+    for index, word in enumerate(words):
+        word = word.upper()
+        if word:
+            indices, group_words = grouped.setdefault(len(word), ([], []))
+            indices.append(index)
+            group_words.append(word)
+
+    letter_codes = np.array([ord(letter) for letter in ALPHABET], dtype=np.uint32)
+    groups = []
+    for length, (indices, group_words) in sorted(grouped.items()):
+        codes = np.frombuffer("".join(group_words).encode("utf-32-le"), dtype=np.uint32).reshape(-1, length)
+        positions = np.stack([np.packbits(codes[:, position, None] == letter_codes, axis=0, bitorder="little").T
+                              for position in range(length)])
+        letters = np.bitwise_or.reduce(positions, axis=0)
+        groups.append((length, np.array(indices, dtype=np.uint32), np.ascontiguousarray(positions), letters))
+    return groups
+
+
+def build(path: str) -> int:
+    """Buduje plik skompilowanego słownika ze wszystkich słów w bazie danych.
+
+    Plik jest zapisywany pod nazwą tymczasową i podmieniany na końcu, więc procesy, które mają otwarty stary plik,
+    mogą go dalej bezpiecznie czytać.
+
+    Args:
+        path: Ścieżka do pliku.
+
+    Returns:
+        Liczba słów w pliku.
+
+    """
+    db_initialize()
+    ids = array("I")
+    difficulties = array("d")
+    offsets = array("I", [0])
+    blob = bytearray()
+    words = []
+    ranges = []
+
+    query = (select(Word.id, Word.category_id, Word.word, Word.difficulty)
+             .join(Category, Category.id == Word.category_id)
+             .order_by(Word.category_id, Word.difficulty.is_(None), Word.difficulty))
+    with engine.connect() as connection:
+        version = get_dictionary_version(connection)
+        names = dict(connection.execute(select(Category.id, Category.name)).all())
+        current = None
+        for word_id, category_id, word, difficulty in connection.execute(query):
+            if current is None or current[0] != category_id:
+                current = [category_id, len(ids), len(ids)]
+                ranges.append(current)
+            if difficulty is not None:
+                current[2] = len(ids) + 1
+            ids.append(word_id)
+            difficulties.append(math.nan if difficulty is None else difficulty)
+            blob += word.encode("utf-8")
+            offsets.append(len(blob))
+            words.append(word)
+
+    categories = bytearray()
+    for index, (category_id, start, scored_end) in enumerate(ranges):
+        end = ranges[index + 1][1] if index + 1 < len(ranges) else len(ids)
+        name = names[category_id].encode("utf-8")
+        categories += struct.pack(CATEGORY_FORMAT, category_id, start, scored_end, end, len(blob), len(name))
+        blob += name
+
+    header_size = struct.calcsize(HEADER_FORMAT)
+    padding = -(header_size + len(categories)) % 8
+    index_offset = header_size + len(categories) + padding + 16 * len(ids) + 4 + len(blob)
+    blob += bytes(-index_offset % 8)
+    index_offset += -index_offset % 8
+
+    alphabet = ALPHABET.encode("utf-8")
+    groups = build_length_groups(words)
+    index = bytearray(struct.pack(INDEX_FORMAT, len(groups), len(alphabet)) + alphabet)
+    index += bytes(-len(index) % 8)
+    data = bytearray()
+    data_offset = index_offset + len(index) + struct.calcsize(GROUP_FORMAT) * len(groups)
+    for length, indices, positions, letters in groups:
+        data += bytes(-(data_offset + len(data)) % 8)
+        index += struct.pack(GROUP_FORMAT, length, len(indices), data_offset + len(data))
+        data += indices.tobytes()
+        data += bytes(-(data_offset + len(data)) % 8)
+        data += positions.tobytes()
+        data += letters.tobytes()
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, len(ids), len(ranges), version, index_offset)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(header)
+        file.write(categories)
+        file.write(bytes(padding))
+        difficulties.tofile(file)
+        ids.tofile(file)
+        offsets.tofile(file)
+        file.write(blob)
+        file.write(index)
+        file.write(data)
+    os.replace(temporary_path, path)
+    return len(ids)
+
+
+class CompiledDictionary:
+    """Klasa reprezentuje otwarty przez mmap plik skompilowanego słownika.
+
+    Args:
+        path: Ścieżka do pliku.
+        rng: Generator liczb losowych dla pick(). Domyślnie nowy random.Random().
+
+    Attributes:
+        rng (random.Random): Generator liczb losowych.
+        version (int): Wersja słownika w bazie danych w chwili budowy pliku.
+        categories (dict[int, CategoryRange]): Zakresy słów według id kategorii.
+        category_ids (list[int]): Posortowane identyfikatory kategorii.
+        difficulties (memoryview): Trudności słów (float64, NaN - brak).
+        ids (memoryview): Identyfikatory słów (uint32).
+        offsets (memoryview): Granice słów w bloku tekstu (uint32).
+        blob (memoryview): Blok tekstu UTF-8.
+        length_groups (dict[int, LengthGroup]): Maski bitowe słów według długości.
+
+    Raises:
+        ValueError: Jeżeli plik nie jest skompilowanym słownikiem w obsługiwanej wersji formatu lub został zbudowany
+            dla innego alfabetu.
+
+    """
+
+    def __init__(self, path: str, rng: random.Random | None = None) -> None:
+        self.rng = rng or random.Random()
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        if len(self._view) < header_size:
+            self.close()
+            raise ValueError(f"Plik {path} nie jest skompilowanym słownikiem.")
+        magic, format_version, word_count, category_count, self.version, index_offset = struct.unpack_from(
+            HEADER_FORMAT, self._view)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Plik {path} nie jest skompilowanym słownikiem w wersji {FORMAT_VERSION}.")
+
+        position = header_size
+        entries = []
+        for _ in range(category_count):
+            entries.append(struct.unpack_from(CATEGORY_FORMAT, self._view, position))
+            position += struct.calcsize(CATEGORY_FORMAT)
+        position += -position % 8
+
+        self.difficulties = self._view[position:position + 8 * word_count].cast("d")
+        position += 8 * word_count
+        self.ids = self._view[position:position + 4 * word_count].cast("I")
+        position += 4 * word_count
+        self.offsets = self._view[position:position + 4 * (word_count + 1)].cast("I")
+        position += 4 * (word_count + 1)
+        self.blob = self._view[position:index_offset]
+
+        group_count, alphabet_size = struct.unpack_from(INDEX_FORMAT, self._view, index_offset)
+        position = index_offset + struct.calcsize(INDEX_FORMAT)
+        if str(self._view[position:position + alphabet_size], "utf-8") != ALPHABET:
+            self.close()
+            raise ValueError(f"Plik {path} został zbudowany dla innego alfabetu - zbuduj go ponownie.")
+        position += alphabet_size
+        position += -position % 8
+        self.length_groups = {}
+        for _ in range(group_count):
+            length, count, offset = struct.unpack_from(GROUP_FORMAT, self._view, position)
+            position += struct.calcsize(GROUP_FORMAT)
+            mask_size = (count + 7) // 8
+            indices = np.frombuffer(self._mmap, dtype=np.uint32, count=count, offset=offset)
+            offset += 4 * count
+            offset += -offset % 8
+            positions = np.frombuffer(self._mmap, dtype=np.uint8, count=length * len(ALPHABET) * mask_size,
+                                      offset=offset).reshape(length, len(ALPHABET), mask_size)
+            offset += positions.nbytes
+            letters = np.frombuffer(self._mmap, dtype=np.uint8, count=len(ALPHABET) * mask_size,
+                                    offset=offset).reshape(len(ALPHABET), mask_size)
+            self.length_groups[length] = LengthGroup(length, indices, positions, letters)
+
+        self.categories = {
+            category_id: CategoryRange(str(self.blob[name_offset:name_offset + name_length], "utf-8"),
+                                       start, scored_end, end)
+            for category_id, start, scored_end, end, name_offset, name_length in entries
+        }
+        self.category_ids = sorted(category_id for category_id, category in self.categories.items()
+                                   if category.end > category.start)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __enter__(self) -> "CompiledDictionary":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def word_bytes(self, index: int) -> memoryview:
+        """Zwraca słowo jako widok na zmapowany plik, bez kopiowania.
+
+        Widok utrzymuje mapowanie pliku przy życiu także po close(); można go zwolnić przez release().
+
+        Args:
+            index: Indeks słowa.
+
+        Returns:
+            Słowo w UTF-8.
+
+        """
+        return self.blob[self.offsets[index]:self.offsets[index + 1]]
+
+    def word(self, index: int) -> str:
+        """Zwraca słowo o podanym indeksie.
+
+        Args:
+            index: Indeks słowa.
+
+        Returns:
+            Słowo.
+
+        """
+        return str(self.word_bytes(index), "utf-8")
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        """Iteruje po wszystkich słowach.
+
+        Yields:
+            Id kategorii i słowo.
+
+        """
+        for category_id, category in self.categories.items():
+            for index in range(category.start, category.end):
+                yield category_id, self.word(index)
+
+    def pick(self, min_difficulty: float | None = None, max_difficulty: float | None = None) -> PickedWord:
+        """Losuje kategorię, a następnie słowo z tej kategorii, tak jak WordPicker.pick_word.
+
+        Args:
+            min_difficulty: Minimalna trudność słowa.
+            max_difficulty: Maksymalna trudność słowa.
+
+        Returns:
+            Wylosowane słowo.
+
+        Raises:
+            LookupError: Jeżeli w słowniku nie ma żadnego pasującego słowa.
+
+        """
+        if min_difficulty is None and max_difficulty is None:
+            if not self.category_ids:
+                raise LookupError("Brak słów w słowniku.")
+            category_id = self.rng.choice(self.category_ids)
+            category = self.categories[category_id]
+            index = self.rng.randrange(category.start, category.end)
+        else:
+            low = float("-inf") if min_difficulty is None else min_difficulty
+            high = float("inf") if max_difficulty is None else max_difficulty
+            ranges = {}
+            for category_id in self.category_ids:
+                category = self.categories[category_id]
+                start = bisect_left(self.difficulties, low, category.start, category.scored_end)
+                end = bisect_right(self.difficulties, high, category.start, category.scored_end)
+                if start < end:
+                    ranges[category_id] = (start, end)
+            if not ranges:
+                raise LookupError("Brak słów o podanej trudności w słowniku.")
+            category_id = self.rng.choice(list(ranges))
+            index = self.rng.randrange(*ranges[category_id])
+        return PickedWord(category_id, self.categories[category_id].name, self.ids[index], self.word(index))
+
+    def is_current(self) -> bool:
+        """Sprawdza, czy plik odpowiada aktualnej wersji słownika w bazie danych.
+
+        Returns:
+            Prawda, jeżeli od zbudowania pliku słownik się nie zmienił.
+
+        """
+        with engine.connect() as connection:
+            return get_dictionary_version(connection) == self.version
+
+    def close(self) -> None:
+        """Zwalnia widoki i zamyka mapowanie pliku.
+
+        Jeżeli wywołujący trzyma jeszcze widoki zwrócone przez word_bytes() lub maski z length_groups, mapowanie
+        zostanie zamknięte dopiero po ich zwolnieniu, a do tego czasu widoki pozostają poprawne.
+        """
+        if self._mmap is None:
+            return
+        self.__dict__.pop("length_groups", None)
+        for name in ("difficulties", "ids", "offsets", "blob"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._view.release()
+        mapping, self._mmap = self._mmap, None
+        try:
+            mapping.close()
+        except BufferError:
+            pass
+
+
+def main() -> None:
+    """Buduje skompilowany słownik lub wypisuje informacje o nim z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Skompilowany słownik wisielca.")
+    parser.add_argument("command", choices=["build", "info"], help="Zbuduj plik z bazy danych lub opisz plik.")
+    parser.add_argument("path", help="Plik skompilowanego słownika.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        print(f"Zapisano {build(args.path)} słów do {args.path}.")
+        return
+    with CompiledDictionary(args.path) as compiled:
+        print(f"{len(compiled)} słów, {len(compiled.categories)} kategorii, wersja słownika {compiled.version}, "
+              f"aktualny: {'tak' if compiled.is_current() else 'nie'}.")
+        for category_id, category in sorted(compiled.categories.items()):
+            print(f"{category_id:>5} {category.name}: {category.end - category.start} słów")
+
+
+if __name__ == "__main__":
+    main()
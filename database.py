@@ -0,0 +1,34 @@
+"""Moduł zawiera jedyny w aplikacji silnik bazy danych, fabrykę sesji oraz bazę deklaratywną modeli.
+
+Adres bazy danych i logowanie zapytań można zmienić zmiennymi środowiskowymi WISIELEC_DATABASE_URL
+i WISIELEC_DB_ECHO (wartość "1" włącza wypisywanie wszystkich zapytań SQL).
+
+Attributes:
+    DATABASE_URL (str): Connection string bazy danych.
+    ECHO (bool): Prawda, jeżeli silnik ma wypisywać wszystkie zapytania SQL.
+    Base: Klasa będąca reprezentacją bazy deklaratywnej.
+    engine (sqlalchemy.engine.Engine): Silnik bazy danych, łączący się z nią przez connection stringa.
+    Session (sqlalchemy.orm.scoped_session): Fabryka sesji połączenia z bazą danych - w obrębie jednego wątku
+        zwraca zawsze tę samą sesję.
+
+"""
+import os
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+
+DATABASE_URL = os.environ.get("WISIELEC_DATABASE_URL", "sqlite:///database.db")
+ECHO = os.environ.get("WISIELEC_DB_ECHO", "0") == "1"
+
+Base = declarative_base()
+engine = create_engine(DATABASE_URL, echo=ECHO)
+Session = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+
+
+@event.listens_for(engine, "connect")
+def enable_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Włącza sprawdzanie kluczy obcych w każdym nowym połączeniu z SQLite."""
+    if engine.dialect.name == "sqlite":
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
@@ -1,24 +1,38 @@
 """Moduł zawiera klasy, będące reprezentacją klas z bazy danych.
 
-Baza danych jest inicjalizowana za pomocą ORM SQLAlchemy. Używana jest baza PostgreSQL.
+Baza danych jest inicjalizowana za pomocą ORM SQLAlchemy. Silnik, sesje i baza deklaratywna znajdują się w module
+database.
+
+Po pełnej inicjalizacji (utworzenie tabel, migracja schematu, przykładowe dane) w bazie SQLite zapisywana jest wersja
+schematu (PRAGMA user_version), dzięki czemu kolejne uruchomienia aplikacji pomijają te kroki. Po każdej zmianie modeli
+wymagającej migracji należy zwiększyć SCHEMA_VERSION.
 
 Attributes:
-    Base: Klasa będąca reprezentacją bazy deklaratywnej.
-    engine (sqlalchemy.engine.Engine): Silnik bazy danych, łączący się z nią przez connection stringa.
+    SCHEMA_VERSION (int): Wersja schematu bazy danych oczekiwana przez modele.
+    WORD_REBUILD_TABLE (str): Tabela, w której budowana jest nowa tabela word podczas migracji.
+    LEGACY_WORD_TABLE (str): Tabela, w której wcześniejsza wersja migracji zostawiała stare słowa.
 
 """
-from sqlalchemy import create_engine, Integer, String, Column
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import (func, insert, inspect, select, update, Float, Integer, String, Column, ForeignKey, MetaData,
+                        Table)
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.orm.attributes import set_committed_value
+
+import profiler
+from database import Base, engine, Session
 
-Base = declarative_base()
-engine = create_engine("sqlite:///database.db", echo=True)
+SCHEMA_VERSION = 2
+WORD_REBUILD_TABLE = "word_new"
+LEGACY_WORD_TABLE = "word_old"
 
 
 class Player(Base):
     """Klasa reprezentuje tabelę zawierającą dane graczy w bazie danych i jednocześnie reprezentująca gracza.
 
     Args:
-        id_player: Klucz główny - identyfikator gracza.
+        id_player: Klucz główny - identyfikator gracza. None, jeżeli identyfikator ma nadać baza danych.
         nickname: Pseudonim gracza.
         password: Zahashowane hasło gracza.
 
@@ -26,31 +40,62 @@ class Player(Base):
         __tablename__ (str): Nazwa tabeli w bazie danych.
         id_player (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca klucz główny - identyfikator
             gracza.
-        nickname (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca pseudonium gracza.
+        nickname (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca pseudonium gracza (unikalne,
+            indeksowane).
         password (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca zahashowane hasło gracza.
-        best_score (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca rekord wygranych gracza.
+        best_score (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca rekord wygranych gracza
+            (indeksowana na potrzeby rankingu).
 
     """
     __tablename__ = "Player"
 
     id_player = Column("IdPlayer", Integer, primary_key=True)
-    nickname = Column("Nickname", String)
+    nickname = Column("Nickname", String, index=True, unique=True)
     password = Column("Password", String)
-    best_score = Column("BestScore", Integer)
+    best_score = Column("BestScore", Integer, index=True)
 
-    def __init__(self, id_player, nickname, password) -> None:
+    def __init__(self, id_player: int | None, nickname: str, password: str) -> None:
         self.id_player = id_player
         self.nickname = nickname
         self.password = password
         self.best_score = 0
 
-    def add_win(self) -> None:
-        """Dodaje graczowi jedną wygraną w kolomnie best_score"""
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        self.best_score += 1
-        session.merge(self)
-        session.commit()
+    @profiler.timed("db.add_win")
+    def add_win(self) -> int | None:
+        """Dodaje graczowi jedną wygraną w kolomnie best_score jednym atomowym zapytaniem UPDATE.
+
+        Returns:
+            Nowa liczba wygranych gracza lub None, jeżeli gracza nie ma w bazie danych.
+
+        """
+        best_score = record_wins({self.id_player: 1}).get(self.id_player)
+        if best_score is not None:
+            set_committed_value(self, "best_score", best_score)
+        return best_score
+
+
+def record_wins(wins: dict[int, int]) -> dict[int, int]:
+    """Dodaje graczom wygrane w jednej transakcji, zwiększając best_score w bazie danych (bez odczytu przed zapisem).
+
+    Args:
+        wins: Słownik, w którym kluczem jest id gracza, a wartością liczba wygranych do dodania.
+
+    Returns:
+        Słownik z nową liczbą wygranych dla każdego istniejącego gracza.
+
+    """
+    best_scores = {}
+    with engine.begin() as connection:
+        for id_player, count in wins.items():
+            best_score = connection.execute(
+                update(Player)
+                .where(Player.id_player == id_player)
+                .values(best_score=func.coalesce(Player.best_score, 0) + count)
+                .returning(Player.best_score)
+            ).scalar_one_or_none()
+            if best_score is not None:
+                best_scores[id_player] = best_score
+    return best_scores
 
 
 class Word(Base):
@@ -61,13 +106,16 @@ class Word(Base):
         id (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca klucz główny - identyfikator słowa.
         word (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca właściwe słowo.
         category_id (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca klucz
-            obcy - odniesienie do kategorii, do której należy słowo.
+            obcy - odniesienie do kategorii, do której należy słowo (indeksowana).
+        difficulty (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca trudność słowa 0 - 1,
+            wyliczaną przez moduł difficulty (NULL, jeżeli jeszcze nie wyliczona).
 
     """
     __tablename__ = 'word'
     id = Column(Integer, primary_key=True)
     word = Column(String(50), nullable=False)
-    category_id = Column(Integer, nullable=False)
+    category_id = Column(Integer, ForeignKey("category.id"), nullable=False, index=True)
+    difficulty = Column(Float, index=True)
 
 
 class Category(Base):
@@ -84,10 +132,205 @@ class Category(Base):
     name = Column(String(50), nullable=False)
 
 
+class DictionaryVersion(Base):
+    """Klasa reprezentuje tabelę z licznikiem wersji słownika (jeden wiersz).
+
+    Licznik jest zwiększany przy każdej zmianie słów lub kategorii (import, przeliczenie trudności, edycja), dzięki
+    czemu procesy trzymające słownik w pamięci (moduł dictionary) wiedzą, kiedy wczytać go na nowo.
+
+    Attributes:
+        __tablename__ (str): Nazwa tabeli w bazie danych.
+        id (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca klucz główny (zawsze 1).
+        version (sqlalchemy.sql.schema.Column): Kolumna w bazie danych zawierająca wersję słownika.
+
+    """
+    __tablename__ = "dictionary_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def get_dictionary_version(connection: Connection) -> int:
+    """Odczytuje wersję słownika.
+
+    Args:
+        connection: Połączenie z bazą danych.
+
+    Returns:
+        Wersja słownika; 0, jeżeli nie była jeszcze zwiększana.
+
+    """
+    return connection.execute(select(DictionaryVersion.version).where(DictionaryVersion.id == 1)).scalar() or 0
+
+
+def bump_dictionary_version(connection: Connection) -> int:
+    """Zwiększa wersję słownika. Należy ją wywołać w tej samej transakcji, w której zmieniane są słowa lub kategorie.
+
+    Args:
+        connection: Połączenie z bazą danych.
+
+    Returns:
+        Nowa wersja słownika.
+
+    """
+    version = connection.execute(
+        update(DictionaryVersion)
+        .where(DictionaryVersion.id == 1)
+        .values(version=DictionaryVersion.version + 1)
+        .returning(DictionaryVersion.version)
+    ).scalar_one_or_none()
+    if version is None:
+        version = 1
+        connection.execute(insert(DictionaryVersion).values(id=1, version=version))
+    return version
+
+
+def word_rebuild_table() -> Table:
+    """Tworzy definicję tabeli o schemacie tabeli word (z kluczem obcym), ale o nazwie WORD_REBUILD_TABLE.
+
+    Returns:
+        Definicja tabeli, bez indeksów w bazie - CreateTable nie tworzy indeksów.
+
+    """
+    metadata = MetaData()
+    Category.__table__.to_metadata(metadata)
+    return Word.__table__.to_metadata(metadata, name=WORD_REBUILD_TABLE)
+
+
+def copy_words(connection: Connection, source: str, target: str) -> int:
+    """Kopiuje słowa między tabelami, pomijając słowa bez istniejącej kategorii i słowa, które już są w target.
+
+    Pominięte słowa bez kategorii są wypisywane, tak jak zduplikowane pseudonimy w migrate_schema.
+
+    Args:
+        connection: Połączenie z bazą danych.
+        source: Tabela źródłowa.
+        target: Tabela docelowa.
+
+    Returns:
+        Liczba pominiętych słów bez istniejącej kategorii.
+
+    """
+    orphaned = connection.exec_driver_sql(
+        f'SELECT id, word, category_id FROM "{source}" '
+        f'WHERE category_id IS NULL OR category_id NOT IN (SELECT id FROM category)').all()
+    for word_id, word, category_id in orphaned:
+        print(f"Pominięto słowo {word!r} (id {word_id}) - kategoria {category_id} nie istnieje.")
+    connection.exec_driver_sql(
+        f'INSERT INTO "{target}" (id, word, category_id) SELECT id, word, category_id FROM "{source}" '
+        f'WHERE category_id IN (SELECT id FROM category) AND id NOT IN (SELECT id FROM "{target}")')
+    return len(orphaned)
+
+
+def recover_word_table() -> bool:
+    """Dokańcza przerwaną przebudowę tabeli word.
+
+    Jeżeli przebudowa przerwała się przed usunięciem starej tabeli word (stara tabela nie ma klucza obcego),
+    niedokończona tabela WORD_REBUILD_TABLE jest usuwana, a migrate_schema powtórzy przebudowę. W przeciwnym razie
+    słowa z WORD_REBUILD_TABLE lub LEGACY_WORD_TABLE są przenoszone do tabeli word.
+
+    Returns:
+        Prawda, jeżeli w bazie danych były pozostałości przebudowy.
+
+    """
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        tables = set(inspector.get_table_names())
+        leftovers = [table for table in (WORD_REBUILD_TABLE, LEGACY_WORD_TABLE) if table in tables]
+        if not leftovers:
+            return False
+
+        if Word.__tablename__ not in tables:
+            connection.execute(CreateTable(Word.__table__))
+            rebuilt = True
+        else:
+            rebuilt = bool(inspector.get_foreign_keys(Word.__tablename__))
+        for table in leftovers:
+            if table == LEGACY_WORD_TABLE or rebuilt:
+                copy_words(connection, table, Word.__tablename__)
+            connection.exec_driver_sql(f'DROP TABLE "{table}"')
+        DictionaryVersion.__table__.create(connection, checkfirst=True)
+        bump_dictionary_version(connection)
+    return True
+
+
+def migrate_schema() -> bool:
+    """Dostosowuje schemat istniejącej bazy danych do modeli - dodaje klucz obcy w tabeli word, brakujące kolumny
+    i brakujące indeksy.
+
+    SQLite nie pozwala dodać klucza obcego do istniejącej tabeli, więc tabela word jest w takim przypadku
+    przebudowywana: słowa z istniejącą kategorią są kopiowane do WORD_REBUILD_TABLE, a stara tabela jest zastępowana
+    nową dopiero po udanym kopiowaniu. Przerwaną przebudowę dokańcza recover_word_table. Jeżeli w tabeli Player są
+    zduplikowane pseudonimy, unikalny indeks nie zostanie utworzony.
+
+    Returns:
+        Prawda, jeżeli udało się utworzyć wszystkie indeksy.
+
+    """
+    with engine.begin() as connection:
+        if not inspect(connection).get_foreign_keys(Word.__tablename__):
+            connection.execute(CreateTable(word_rebuild_table()))
+            copy_words(connection, Word.__tablename__, WORD_REBUILD_TABLE)
+            connection.exec_driver_sql("DROP TABLE word")
+            connection.exec_driver_sql(f'ALTER TABLE "{WORD_REBUILD_TABLE}" RENAME TO word')
+
+        inspector = inspect(connection)
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    connection.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" '
+                                               f'{column.type.compile(engine.dialect)}')
+
+    complete = True
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except IntegrityError:
+                complete = False
+                print(f"Nie można utworzyć indeksu {index.name} - w tabeli {table.name} są zduplikowane wartości. "
+                      f"Usuń duplikaty; migracja zostanie powtórzona przy następnym uruchomieniu.")
+    return complete
+
+
+def get_schema_version() -> int:
+    """Odczytuje wersję schematu zapisaną w bazie danych.
+
+    Returns:
+        Wersja schematu; 0, jeżeli baza nie była jeszcze inicjalizowana lub nie jest bazą SQLite.
+
+    """
+    if engine.dialect.name != "sqlite":
+        return 0
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def set_schema_version(version: int) -> None:
+    """Zapisuje wersję schematu w bazie danych (tylko SQLite).
+
+    Args:
+        version: Wersja schematu.
+
+    """
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
 def db_initialize() -> None:
-    """Wstawia do bazy danych przykładowe dane; inicjalizuje tabele w bazie danych."""
+    """Wstawia do bazy danych przykładowe dane; inicjalizuje tabele w bazie danych.
+
+    Jeżeli któreś słowo nie ma wyliczonej trudności (nowe przykładowe dane lub dodana migracją kolumna difficulty),
+    przeliczana jest trudność wszystkich słów. Jeżeli baza danych ma już aktualną wersję schematu i nie ma w niej
+    pozostałości przerwanej przebudowy tabeli word (zob. recover_word_table), nic nie jest robione.
+    Wersja schematu nie jest zapisywana, jeżeli migracja nie utworzyła wszystkich indeksów (np. unikalnego indeksu
+    pseudonimów przy zduplikowanych graczach), więc migracja jest powtarzana przy każdym uruchomieniu.
+    """
+    if not recover_word_table() and get_schema_version() == SCHEMA_VERSION:
+        return
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
+    migrated = migrate_schema()
     session = Session()
 
     if session.query(Category).count() == 0 and session.query(Word).count() == 0:
@@ -199,3 +442,12 @@ def db_initialize() -> None:
 
         session.add_all(words)
         session.commit()
+        with engine.begin() as connection:
+            bump_dictionary_version(connection)
+
+    if session.query(Word).filter(Word.difficulty.is_(None)).count():
+        import difficulty
+        difficulty.update_scores()
+
+    if migrated:
+        set_schema_version(SCHEMA_VERSION)
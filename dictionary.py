@@ -0,0 +1,153 @@
+"""Moduł zawiera współdzieloną w procesie pamięć podręczną słownika - wszystkich kategorii i słów z bazy danych.
+
+Słownik jest wczytywany jednym zapytaniem do zwartych struktur: dla każdej kategorii tablica id słów (array),
+lista słów (napisy internowane przez sys.intern) i tablica trudności, posortowane według trudności. Losowanie słowa
+nie dotyka wtedy bazy danych.
+
+O zmianach słownika informuje licznik w tabeli dictionary_version, zwiększany przez import słów, przeliczenie
+trudności i inne edycje. Zmiany w tym samym procesie unieważniają pamięć od razu (invalidate), a zmiany z innych
+procesów są wykrywane przez odczyt licznika, nie częściej niż co check_interval sekund.
+
+Attributes:
+    CHECK_INTERVAL (float): Domyślny odstęp w sekundach między sprawdzeniami wersji słownika w bazie danych.
+    cache (DictionaryCache): Współdzielony w procesie słownik.
+
+"""
+import sys
+import time
+from array import array
+
+from sqlalchemy import select
+
+from database import engine
+from db_initialize import Category, Word, db_initialize, get_dictionary_version
+
+CHECK_INTERVAL = 30.0
+
+
+class CategoryWords:
+    """Klasa reprezentuje słowa jednej kategorii, posortowane według trudności (słowa bez trudności są na końcu).
+
+    Args:
+        name: Nazwa kategorii.
+
+    Attributes:
+        name (str): Nazwa kategorii.
+        ids (array): Identyfikatory słów.
+        words (list[str]): Słowa, w tej samej kolejności co ids.
+        difficulties (array): Posortowane trudności słów - tylko słów z wyliczoną trudnością, więc i-ta trudność
+            należy do i-tego słowa.
+
+    """
+    __slots__ = ("name", "ids", "words", "difficulties")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.ids = array("l")
+        self.words = []
+        self.difficulties = array("d")
+
+
+class DictionaryCache:
+    """Klasa reprezentuje słownik trzymany w pamięci i odświeżany po zmianie wersji słownika w bazie danych.
+
+    Args:
+        check_interval: Odstęp w sekundach między sprawdzeniami wersji słownika. None - wersja nie jest sprawdzana,
+            a słownik jest wczytywany na nowo tylko po invalidate().
+
+    Attributes:
+        check_interval (float | None): Odstęp między sprawdzeniami wersji słownika.
+        version (int | None): Wersja wczytanego słownika albo None, jeżeli słownik trzeba wczytać.
+        checked_at (float): Czas ostatniego sprawdzenia wersji (time.monotonic).
+        categories (dict[int, CategoryWords]): Słowa w podziale na id kategorii - tylko kategorie mające słowa.
+        category_ids (list[int]): Posortowane identyfikatory kategorii mających słowa.
+
+    """
+
+    def __init__(self, check_interval: float | None = CHECK_INTERVAL) -> None:
+        self.check_interval = check_interval
+        self.version = None
+        self.checked_at = 0.0
+        self.categories = {}
+        self.category_ids = []
+
+    def load(self) -> None:
+        """Wczytuje z bazy danych wszystkie kategorie i słowa.
+
+        Przed pierwszym odczytem baza danych jest inicjalizowana (db_initialize), więc słownik działa także na bazie
+        bez tabeli dictionary_version i kolumny difficulty, np. w simulation.py lub server.py.
+        """
+        db_initialize()
+        categories = {}
+        query = (select(Word.id, Word.category_id, Word.word, Word.difficulty)
+                 .order_by(Word.difficulty.is_(None), Word.difficulty))
+        with engine.connect() as connection:
+            version = get_dictionary_version(connection)
+            names = dict(connection.execute(select(Category.id, Category.name)).all())
+            for word_id, category_id, word, difficulty in connection.execute(query):
+                category = categories.get(category_id)
+                if category is None:
+                    if category_id not in names:
+                        continue
+                    category = categories[category_id] = CategoryWords(sys.intern(names[category_id]))
+                category.ids.append(word_id)
+                category.words.append(sys.intern(word))
+                if difficulty is not None:
+                    category.difficulties.append(difficulty)
+
+        self.categories = categories
+        self.category_ids = sorted(categories)
+        self.version = version
+        self.checked_at = time.monotonic()
+
+    def refresh(self) -> None:
+        """Wczytuje słownik, jeżeli nie był wczytany, został unieważniony lub zmieniła się jego wersja w bazie."""
+        if self.version is None:
+            self.load()
+            return
+        if self.check_interval is None or time.monotonic() - self.checked_at < self.check_interval:
+            return
+        with engine.connect() as connection:
+            version = get_dictionary_version(connection)
+        self.checked_at = time.monotonic()
+        if version != self.version:
+            self.load()
+
+    def invalidate(self) -> None:
+        """Wymusza ponowne wczytanie słownika przy następnym użyciu."""
+        self.version = None
+
+    def get_categories(self) -> dict[int, CategoryWords]:
+        """Zwraca aktualne słowa w podziale na kategorie.
+
+        Returns:
+            Słowa w podziale na id kategorii.
+
+        """
+        self.refresh()
+        return self.categories
+
+    def get_words_by_name(self) -> dict[str, list[str]]:
+        """Zwraca wszystkie słowa pisane wielkimi literami w podziale na nazwy kategorii.
+
+        Returns:
+            Słownik, w którym kluczem jest nazwa kategorii, a wartością lista słów.
+
+        """
+        dictionary = {}
+        for category in self.get_categories().values():
+            dictionary.setdefault(category.name, []).extend(word.upper() for word in category.words)
+        return dictionary
+
+
+cache = DictionaryCache()
+
+
+def load_dictionary() -> dict[str, list[str]]:
+    """Zwraca wszystkie słowa w podziale na kategorie, ze współdzielonego słownika.
+
+    Returns:
+        Słownik, w którym kluczem jest nazwa kategorii, a wartością lista słów pisanych wielkimi literami.
+
+    """
+    return cache.get_words_by_name()
@@ -0,0 +1,145 @@
+"""Moduł wylicza trudność wszystkich słów w słowniku, wektorowo w NumPy.
+
+Trudność słowa to ważona suma czterech cech, każda znormalizowana do przedziału 0 - 1 w obrębie całego słownika:
+
+- oczekiwana liczba błędnych strzałów gracza zgadującego litery od najczęstszej,
+- rzadkość liter słowa (średnia z -log2 częstości litery w słowniku),
+- liczba różnych liter,
+- długość słowa (krótsze słowa są trudniejsze).
+
+Częstości liter zależą od całego słownika, dlatego po imporcie słów trzeba przeliczyć wszystkie słowa naraz.
+
+Przykład użycia z linii poleceń::
+
+    python difficulty.py
+
+Attributes:
+    WEIGHTS (dict[str, float]): Wagi poszczególnych cech w wyniku.
+
+"""
+import time
+from typing import Sequence
+
+import numpy as np
+
+import dictionary
+from database import engine
+from db_initialize import Base, bump_dictionary_version, migrate_schema
+from game_state import ALPHABET
+
+WEIGHTS = {
+    "wrong_guesses": 0.5,
+    "rarity": 0.25,
+    "distinct_letters": 0.15,
+    "shortness": 0.1,
+}
+
+
+def encode_words(words: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Zamienia słowa na macierz obecności liter alfabetu oraz wektor długości słów.
+
+    Args:
+        words: Słowa do zakodowania.
+
+    Returns:
+        Macierz logiczna (liczba słów x długość alfabetu), w której True oznacza, że litera występuje w słowie,
+        oraz wektor długości słów.
+
+    """
+    upper_words = [word.upper() for word in words]
+    lengths = np.fromiter(map(len, upper_words), dtype=np.int64, count=len(upper_words))
+    code_points = np.frombuffer("".join(upper_words).encode("utf-32-le"), dtype=np.uint32)
+
+    lookup = np.full(max(map(ord, ALPHABET)) + 1, -1, dtype=np.int64)
+    lookup[[ord(letter) for letter in ALPHABET]] = np.arange(len(ALPHABET))
+    letter_indexes = np.full(code_points.shape, -1, dtype=np.int64)
+    in_range = code_points < lookup.size
+    letter_indexes[in_range] = lookup[code_points[in_range]]
+
+    word_indexes = np.repeat(np.arange(len(upper_words)), lengths)
+    valid = letter_indexes >= 0
+    presence = np.zeros((len(upper_words), len(ALPHABET)), dtype=bool)
+    presence[word_indexes[valid], letter_indexes[valid]] = True
+    return presence, lengths
+
+
+def normalize(values: np.ndarray) -> np.ndarray:
+    """Skaluje wartości liniowo do przedziału 0 - 1.
+
+    Args:
+        values: Wartości do przeskalowania.
+
+    Returns:
+        Przeskalowane wartości (zera, jeżeli wszystkie wartości są równe).
+
+    """
+    values = values.astype(np.float64)
+    spread = values.max() - values.min()
+    if spread == 0:
+        return np.zeros_like(values)
+    return (values - values.min()) / spread
+
+
+def compute_scores(words: Sequence[str]) -> np.ndarray:
+    """Wylicza trudność wszystkich słów naraz.
+
+    Args:
+        words: Wszystkie słowa słownika.
+
+    Returns:
+        Wektor trudności 0 - 1, w tej samej kolejności co słowa.
+
+    """
+    if not words:
+        return np.zeros(0)
+    presence, lengths = encode_words(words)
+    distinct_letters = presence.sum(axis=1)
+
+    frequencies = presence.mean(axis=0)
+    rarity = -np.log2(np.where(frequencies > 0, frequencies, 1.0))
+    mean_rarity = (presence * rarity).sum(axis=1) / np.maximum(distinct_letters, 1)
+
+    # Gracz zgadujący od najczęstszej litery potrzebuje tylu strzałów, ile wynosi najdalsza pozycja litery słowa
+    # w tej kolejności; wszystkie strzały ponad liczbę różnych liter są błędne.
+    ranks = np.empty(len(ALPHABET), dtype=np.int64)
+    ranks[np.argsort(-frequencies, kind="stable")] = np.arange(1, len(ALPHABET) + 1)
+    wrong_guesses = (presence * ranks).max(axis=1) - distinct_letters
+
+    return (WEIGHTS["wrong_guesses"] * normalize(wrong_guesses)
+            + WEIGHTS["rarity"] * normalize(mean_rarity)
+            + WEIGHTS["distinct_letters"] * normalize(distinct_letters)
+            + WEIGHTS["shortness"] * (1 - normalize(lengths)))
+
+
+def update_scores() -> int:
+    """Przelicza trudność wszystkich słów w bazie danych i zapisuje ją w kolumnie difficulty.
+
+    Kolumna difficulty musi już istnieć (zob. db_initialize.migrate_schema).
+
+    Returns:
+        Liczba zaktualizowanych słów.
+
+    """
+    with engine.begin() as connection:
+        rows = connection.exec_driver_sql("SELECT id, word FROM word").fetchall()
+        ids = [row[0] for row in rows]
+        scores = compute_scores([row[1] for row in rows])
+        if ids:
+            connection.exec_driver_sql("UPDATE word SET difficulty = ? WHERE id = ?",
+                                       list(zip(scores.tolist(), ids)))
+            bump_dictionary_version(connection)
+    dictionary.cache.invalidate()
+    return len(ids)
+
+
+def main() -> None:
+    """Przelicza trudność słów z linii poleceń."""
+    start = time.perf_counter()
+    Base.metadata.create_all(engine)
+    migrate_schema()
+    count = update_scores()
+    print(f"Przeliczono trudność {count} słów w {time.perf_counter() - start:.2f} s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Moduł zawiera eksport statystyk graczy z bazy danych do pliku, w stałej pamięci.
+
+Wiersze tabeli Player są pobierane z bazy danych paczkami (yield_per) i od razu zapisywane do pliku, więc zużycie
+pamięci nie zależy od liczby graczy.
+
+Obsługiwane formaty:
+    csv: Kolumny IdPlayer, Nickname i BestScore.
+    jsonl: Obiekty z kluczami IdPlayer, Nickname i BestScore, po jednym w linii.
+    parquet: Plik kolumnowy, zapisywany paczkami jako grupy wierszy (wymaga pakietu pyarrow).
+
+Przykład użycia z linii poleceń::
+
+    python export.py statystyki.parquet
+
+Attributes:
+    BATCH_SIZE (int): Liczba wierszy pobieranych z bazy danych i zapisywanych naraz.
+    COLUMNS (tuple[str, ...]): Nazwy eksportowanych kolumn.
+
+"""
+import argparse
+import csv
+import json
+import time
+from typing import Callable, Iterable, Iterator, NamedTuple, Sequence
+
+from sqlalchemy import func, select
+
+from database import engine
+from db_initialize import Player
+
+BATCH_SIZE = 10000
+COLUMNS = ("IdPlayer", "Nickname", "BestScore")
+
+
+class ExportResult(NamedTuple):
+    """Wynik eksportu statystyk.
+
+    Attributes:
+        exported (int): Liczba wyeksportowanych graczy.
+        seconds (float): Czas trwania eksportu w sekundach.
+
+    """
+    exported: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Liczba wyeksportowanych graczy na sekundę."""
+        return self.exported / self.seconds if self.seconds > 0 else 0.0
+
+
+def detect_format(path: str) -> str:
+    """Rozpoznaje format pliku po jego rozszerzeniu.
+
+    Args:
+        path: Ścieżka do pliku.
+
+    Returns:
+        Nazwa formatu: "csv", "jsonl" albo "parquet".
+
+    """
+    extension = path.rsplit(".", 1)[-1].lower()
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension in ("parquet", "pq"):
+        return "parquet"
+    return "csv"
+
+
+def write_csv(path: str, batches: Iterable[Sequence[tuple]]) -> None:
+    """Zapisuje paczki wierszy do pliku CSV.
+
+    Args:
+        path: Ścieżka do pliku.
+        batches: Paczki wierszy (IdPlayer, Nickname, BestScore).
+
+    """
+    with open(path, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        for batch in batches:
+            writer.writerows(batch)
+
+
+def write_jsonl(path: str, batches: Iterable[Sequence[tuple]]) -> None:
+    """Zapisuje paczki wierszy do pliku JSONL.
+
+    Args:
+        path: Ścieżka do pliku.
+        batches: Paczki wierszy (IdPlayer, Nickname, BestScore).
+
+    """
+    with open(path, mode="w", encoding="utf-8") as file:
+        for batch in batches:
+            file.writelines(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False) + "\n" for row in batch)
+
+
+def write_parquet(path: str, batches: Iterable[Sequence[tuple]]) -> None:
+    """Zapisuje paczki wierszy do pliku Parquet - każda paczka to osobna grupa wierszy.
+
+    Args:
+        path: Ścieżka do pliku.
+        batches: Paczki wierszy (IdPlayer, Nickname, BestScore).
+
+    Raises:
+        ImportError: Jeżeli nie jest zainstalowany pakiet pyarrow.
+
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Eksport do formatu Parquet wymaga pakietu pyarrow.") from error
+
+    schema = pa.schema([("IdPlayer", pa.int64()), ("Nickname", pa.string()), ("BestScore", pa.int64())])
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_pylist([dict(zip(COLUMNS, row)) for row in batch], schema=schema))
+
+
+WRITERS = {
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+    "parquet": write_parquet,
+}
+
+
+def count_players() -> int:
+    """Zlicza graczy w bazie danych.
+
+    Returns:
+        Liczba graczy.
+
+    """
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(Player)).scalar_one()
+
+
+def iter_batches(batch_size: int = BATCH_SIZE) -> Iterator[Sequence[tuple]]:
+    """Pobiera strumieniowo statystyki wszystkich graczy, posortowane według id.
+
+    Args:
+        batch_size: Liczba wierszy w paczce.
+
+    Yields:
+        Paczki wierszy (IdPlayer, Nickname, BestScore).
+
+    """
+    query = select(Player.id_player, Player.nickname, Player.best_score).order_by(Player.id_player)
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(query)
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+
+def export_players(path: str, file_format: str | None = None, batch_size: int = BATCH_SIZE,
+                   progress: Callable[[int, int], None] | None = None) -> ExportResult:
+    """Eksportuje statystyki wszystkich graczy do pliku.
+
+    Args:
+        path: Ścieżka do pliku.
+        file_format: Format pliku: "csv", "jsonl" albo "parquet". Jeżeli None, rozpoznawany po rozszerzeniu.
+        batch_size: Liczba wierszy pobieranych i zapisywanych naraz.
+        progress: Funkcja wywoływana po każdej paczce z liczbą wyeksportowanych dotąd graczy i liczbą wszystkich
+            graczy.
+
+    Returns:
+        Wynik eksportu.
+
+    """
+    start = time.perf_counter()
+    writer = WRITERS[file_format or detect_format(path)]
+    total = count_players() if progress else 0
+    exported = 0
+
+    def counted(batches: Iterable[Sequence[tuple]]) -> Iterator[Sequence[tuple]]:
+        nonlocal exported
+        for batch in batches:
+            yield batch
+            exported += len(batch)
+            if progress:
+                progress(exported, total)
+
+    writer(path, counted(iter_batches(batch_size)))
+    return ExportResult(exported, time.perf_counter() - start)
+
+
+def main() -> None:
+    """Uruchamia eksport z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Eksport statystyk graczy wisielca.")
+    parser.add_argument("path", help="Plik wynikowy (.csv, .jsonl lub .parquet).")
+    parser.add_argument("--format", choices=list(WRITERS), help="Format pliku.")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Liczba wierszy zapisywanych naraz.")
+    args = parser.parse_args()
+
+    result = export_players(args.path, args.format, args.batch_size,
+                            progress=lambda done, total: print(f"Wyeksportowano {done}/{total} graczy...",
+                                                               flush=True))
+    print(f"Wyeksportowano {result.exported} graczy w {result.seconds:.2f} s "
+          f"({result.rows_per_second:.0f} graczy/s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Moduł zawiera współdzielony rejestr czcionek oraz pamięć podręczną wyrenderowanych napisów.
+
+Czcionki i napisy są trzymane przez cały czas życia procesu, dlatego po zakończeniu gry należy zamykać tylko
+okno (pygame.display.quit()), a nie cały pygame - pygame.quit() unieważnia wszystkie obiekty czcionek.
+
+Attributes:
+    FONT_NAME (str): Nazwa czcionki używanej w grze.
+    TEXT_CACHE_SIZE (int): Maksymalna liczba wyrenderowanych napisów trzymanych w pamięci podręcznej.
+
+"""
+import functools
+
+import pygame
+
+import profiler
+
+FONT_NAME = "Comic sans MS"
+TEXT_CACHE_SIZE = 256
+
+_font_registry: dict[tuple[str, int], pygame.font.Font] = {}
+
+
+def get_font(size: int, name: str = FONT_NAME) -> pygame.font.Font:
+    """Zwraca czcionkę systemową, wyszukując ją tylko przy pierwszym użyciu.
+
+    Args:
+        size: Rozmiar czcionki.
+        name: Nazwa czcionki systemowej.
+
+    Returns:
+        Czcionka o podanej nazwie i rozmiarze.
+
+    """
+    font = _font_registry.get((name, size))
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size)
+        _font_registry[(name, size)] = font
+    return font
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+@profiler.timed("render_text")
+def render_text(text: str, size: int, color: str | tuple[int, int, int] = "black",
+                name: str = FONT_NAME) -> pygame.Surface:
+    """Renderuje napis, korzystając z pamięci podręcznej (LRU) wcześniej wyrenderowanych napisów.
+
+    Zwrócona powierzchnia jest współdzielona, więc można ją tylko rysować - nie wolno jej modyfikować. Przy włączonych
+    pomiarach (moduł profiler) mierzony jest czas samego renderowania, czyli tylko chybień pamięci podręcznej.
+
+    Args:
+        text: Napis do wyrenderowania.
+        size: Rozmiar czcionki.
+        color: Kolor napisu.
+        name: Nazwa czcionki systemowej.
+
+    Returns:
+        Powierzchnia z wyrenderowanym napisem.
+
+    """
+    return get_font(size, name).render(text, True, color)
+
+
+def get_cache_stats() -> dict[str, int]:
+    """Zwraca liczniki trafień i chybień pamięci podręcznej napisów oraz liczbę załadowanych czcionek.
+
+    Returns:
+        Słownik z licznikami trafień (text_hits) i chybień (text_misses) oraz liczbą trzymanych czcionek i napisów.
+
+    """
+    text_info = render_text.cache_info()
+    return {
+        "fonts": len(_font_registry),
+        "text_hits": text_info.hits,
+        "text_misses": text_info.misses,
+        "texts": text_info.currsize,
+    }
+
+
+def clear_cache() -> None:
+    """Czyści rejestr czcionek i pamięć podręczną napisów, np. przed wywołaniem pygame.quit()."""
+    render_text.cache_clear()
+    _font_registry.clear()
@@ -4,51 +4,38 @@ Attributes:
     WIDTH (int): Szerokość okna gry.
     HEIGHT (int): Wysokość okna gry.
     FPS (int): Ilość renderowanych klatek na sekundę.
+    EVENT_TIMEOUT (int): Maksymalny czas oczekiwania na zdarzenie w pętli sterowanej zdarzeniami, w milisekundach.
     BG_COLOR (touple[int, int, int]): Kolor tła w formacie RGB.
-    ALPHABET (str): Polski alfabet.
-    Base: Klasa będąca reprezentacją bazy deklaratywnej.
-    engine (sqlalchemy.engine.Engine): Silnik bazy danych, łączący się z nią przez connection stringa.
-    Session: Klasa reprezentująca sesję połączenia z bazą danych.
+    PLAYER_FONT_SIZE (int): Rozmiar czcionki napisu, kogo jest tura.
+    WORD_FONT_SIZE (int): Rozmiar czcionki kategorii i słowa.
+    OVERLAY_FONT_SIZE (int): Rozmiar czcionki nakładki z pomiarami czasu.
+    OVERLAY_FONT_NAME (str): Nazwa czcionki nakładki z pomiarami czasu.
+    BUTTON_COLUMNS (int): Liczba kolumn przycisków z literami.
 
 """
+import time
 import tkinter.messagebox as messagebox
-from typing import Type
 
 import pygame
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker, declarative_base
 
-from button import Button
+import assets
+import profiler
+import word_picker
+from button import Button, ButtonGrid
+from fonts import get_font, render_text
 from db_initialize import Category, Word, Player
+from game_state import ALPHABET, GameState
 
 WIDTH = 1600
 HEIGHT = 900
 FPS = 60
+EVENT_TIMEOUT = 1000
 BG_COLOR = (9, 161, 139)
-ALPHABET = "AĄBCĆDEĘFGHIJKLŁMNŃOÓPRSŚTUWYZŻŹ"
-
-Base = declarative_base()
-
-engine = create_engine("sqlite:///database.db", echo=True)
-Session = sessionmaker(bind=engine)
-
-
-def find_indexes(letter: str, text: str) -> list[int]:
-    """Znajduje wszystkie indeksy, na których znajduję się konkretny znak w napisie.
-
-    Args:
-        letter: Litera, kórej występowania szukamy.
-        text: Napisa, w którym występowań litery szukamy.
-
-    Returns:
-        Lista indeksów, na których znajduję się dany znak w napisie.
-
-    """
-    indexes = []
-    for i, char in enumerate(text):
-        if char == letter:
-            indexes.append(i)
-    return indexes
+PLAYER_FONT_SIZE = 50
+WORD_FONT_SIZE = 40
+OVERLAY_FONT_SIZE = 16
+OVERLAY_FONT_NAME = "monospace"
+BUTTON_COLUMNS = 4
 
 
 class Game:
@@ -60,16 +47,16 @@ class Game:
 
     Attributes:
         clock (pygame.time.Clock): Zegar pomagający taktować odświerzanie klatek.
-        player_font (tkinter.font.Font): Czcionka użwywana przy przy renderowaniu napisu, kogo jest tura.
-        word_font (tkinter.font.Font): Czcionka użwywana przy przy renderowaniu kategorii i słowa.
+        player_font (pygame.font.Font): Czcionka użwywana przy przy renderowaniu napisu, kogo jest tura.
+        word_font (pygame.font.Font): Czcionka użwywana przy przy renderowaniu kategorii i słowa.
         is_running (bool): Prawda, jeżeli rogrywka ma trwać nadal.
         images (list[pygame.Surface]): Lista zawierająca obrazki ze stanem wisielca.
         screen (pygame.Surface): Powierzchnia będąca głównym ekranem gry.
         difficulty (int): Poziom trudności: 0 - klasyczny, 1 - hradcore.
+        state (GameState): Stan rozgrywki, niezależny od renderowania.
         current_step (int): Obecny stan wisielca 0 - 10.
         players (list[Player]): Lista zawierająca graczy biorących udział w rozgrywce.
         current_player (int): Indeks obecnego gracza (z listy players).
-        session (sqlalchemy.orm.Session): Sesja połączenia do bazy danych.
         category (Category): Kategoria zgadywanego słowa.
         word (Word): Zgadywane sowo.
         category_string (str): Kategoria zgadywanego słowa w postaci napisu.
@@ -87,78 +74,157 @@ class Game:
         guessed_word_surface (pygame.Surface): Powierzchnia z napisem zawierającym guessed_word.
         guessed_word_rect (pygame.Rect): Prostokąt z powierzchnią z napisem zawierającym guessed_word.
         buttons (list[Button]): Lista zwierające wszystkie przyciski z literami.
+        button_grid (ButtonGrid): Indeks przycisków, wyznaczający kliknięty przycisk.
+        dirty_rendering (bool): Prawda, jeżeli przerysowywane mają być tylko zmienione fragmenty ekranu.
+        needs_full_redraw (bool): Prawda, jeżeli w następnej klatce trzeba przerysować cały ekran.
+        dirty_rects (list[pygame.Rect]): Fragmenty ekranu, które zmieniły się od ostatniej klatki.
+        frame_count (int): Liczba narysowanych klatek.
+        frame_time (float): Czas rysowania ostatniej klatki w milisekundach.
+        total_frame_time (float): Łączny czas rysowania wszystkich klatek w milisekundach.
+        event_driven (bool): Prawda, jeżeli pętla gry ma czekać na zdarzenia zamiast odświeżać ekran co klatkę.
+        profiler (profiler.Profiler | None): Obiekt zbierający pomiary czasu albo None, jeżeli pomiary są wyłączone.
+        overlay (profiler.Overlay | None): Nakładka z wynikami pomiarów albo None, jeżeli pomiary są wyłączone.
+        show_overlay (bool): Prawda, jeżeli nakładka ma być widoczna (przełączane klawiszem F3).
 
     """
 
     def __init__(self, player1: Player, player2: Player) -> None:
         pygame.init()
+        self.profiler = profiler.get_profiler()
 
         self.clock = pygame.time.Clock()
-        self.player_font = pygame.font.SysFont("Comic sans MS", 50)
-        self.word_font = pygame.font.SysFont("Comic sans MS", 40)
+        self.player_font = get_font(PLAYER_FONT_SIZE)
+        self.word_font = get_font(WORD_FONT_SIZE)
         self.is_running = True
-        self.images = [pygame.image.load(f"img/{i}.png") for i in range(11)]
 
+        pygame.display.set_icon(assets.get_icon())
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Wisielec")
-        pygame.display.set_icon(pygame.image.load("img/icon.png"))
+        self.images = assets.get_stages()
 
         self.difficulty = 0
-        self.current_step = 0
         self.players = [player1, player2]
-        self.current_player = 0
 
-        self.session = Session()
         self.category, self.word = self.pick_category_and_word()
         self.category_string = self.category.name
         self.word_string = self.word.word.upper()
-        self.session.commit()
 
-        self.letters_remaining = len(self.word_string)
-        self.guessed_word_list = ["_" for _ in range(self.letters_remaining)]
-        self.guessed_word = self.get_guessed_word()
-        self.winner = None
+        self.state = GameState(self.word_string, self.players)
 
         self.hangman_surface = self.images[0]
         self.hangman_rect = self.hangman_surface.get_rect(midleft=(0, 300))
 
-        self.current_player_surface = self.player_font.render(
-            f"Tura gracza: {self.players[self.current_player].nickname}", True, "black")
+        self.current_player_surface = render_text(
+            f"Tura gracza: {self.players[self.current_player].nickname}", PLAYER_FONT_SIZE)
         self.current_player_rect = self.current_player_surface.get_rect(midtop=(1100, 10))
 
-        self.category_surface = self.word_font.render(f"Kategoria: {self.category_string}", True, "black")
+        self.category_surface = render_text(f"Kategoria: {self.category_string}", WORD_FONT_SIZE)
         self.category_rect = self.category_surface.get_rect(topleft=(40, 630))
 
-        self.guessed_word_surface = self.word_font.render(self.guessed_word, True, "black")
+        self.guessed_word_surface = render_text(self.guessed_word, WORD_FONT_SIZE)
         self.guessed_word_rect = self.guessed_word_surface.get_rect(topleft=(40, 750))
 
         self.buttons = []
         self.load_buttons()
+        self.button_grid = ButtonGrid(self.buttons)
+
+        self.dirty_rendering = True
+        self.needs_full_redraw = True
+        self.dirty_rects = []
+        self.frame_count = 0
+        self.frame_time = 0.0
+        self.total_frame_time = 0.0
+        self.event_driven = False
+
+        self.overlay = None
+        if self.profiler is not None:
+            self.overlay = profiler.Overlay(self.profiler, get_font(OVERLAY_FONT_SIZE, OVERLAY_FONT_NAME))
+        self.show_overlay = True
 
     def run(self) -> None:
         """Odpala grę w pętli."""
         print(f"Poziom trudności: {self.difficulty}")
+        if self.event_driven:
+            self.run_event_driven()
+        else:
+            while self.is_running:
+                start = time.perf_counter()
+                self.check_input()
+                self.draw_content()
+                self.check_finish()
+                self.record_frame(start)
+                self.clock.tick(FPS)
+
+        if self.profiler is not None:
+            print(f"Średni czas klatki: {self.get_average_frame_time():.3f} ms")
+        # Zamykamy tylko okno, żeby czcionki z modułu fonts pozostały ważne w kolejnych grach.
+        pygame.display.quit()
+
+    def run_event_driven(self) -> None:
+        """Odpala grę w pętli, która śpi do nadejścia zdarzenia i przerysowuje ekran tylko po zmianie stanu gry."""
+        self.draw_content()
         while self.is_running:
-            self.check_input()
-            self.draw_content()
-            self.check_finish()
-            self.clock.tick(FPS)
+            events = [pygame.event.wait(EVENT_TIMEOUT)]
+            start = time.perf_counter()
+            events.extend(pygame.event.get())
+            changed = False
+            for event in events:
+                if self.handle_event(event):
+                    changed = True
+            if changed:
+                self.draw_content()
+                self.check_finish()
+                self.record_frame(start)
+
+    def record_frame(self, start: float) -> None:
+        """Zapisuje czas obsługi klatki (bez czekania na następną), jeżeli pomiary są włączone.
 
-        pygame.quit()
+        Args:
+            start: Początek klatki (time.perf_counter).
+
+        """
+        if self.profiler is not None:
+            self.profiler.record("frame", (time.perf_counter() - start) * 1000)
 
+    @profiler.timed("check_input")
     def check_input(self) -> None:
         """Sprawdza input gracza w event loopie"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.is_running = False
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for button in self.buttons:
-                    if button.collidepoint(event.pos):
-                        if self.difficulty == 0:
-                            button.is_visible = False
+            self.handle_event(event)
 
-                        self.check_letter(button)
-                        self.change_player()
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Obsługuje pojedyncze zdarzenie pygame.
+
+        Args:
+            event: Zdarzenie do obsłużenia.
+
+        Returns:
+            Prawda, jeżeli zdarzenie zmieniło stan gry lub wymaga przerysowania ekranu.
+
+        """
+        changed = False
+        if event.type == pygame.QUIT:
+            self.is_running = False
+            changed = True
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.needs_full_redraw = True
+            changed = True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and self.overlay is not None:
+            self.show_overlay = not self.show_overlay
+            if self.overlay.rect is not None:
+                self.mark_dirty(self.overlay.rect)
+            changed = True
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            button = self.button_grid.hit(event.pos)
+            if button is not None:
+                if self.difficulty == 0:
+                    button.is_visible = False
+                    self.mark_dirty(button)
+
+                self.check_letter(button)
+                self.change_player()
+                changed = True
+        return changed
 
     def check_letter(self, button: Button) -> None:
         """Sprawdza, czy litera na klikniętym przycisku jest w słowie. Jeżeli nie, to rysujemy wysielca.
@@ -167,42 +233,105 @@ class Game:
             button: Przycisk, którego litera jest sprawdzana.
 
         """
-        if button.letter in self.word_string:
-            indexes = find_indexes(button.letter, self.word_string)
-            for index in indexes:
-                self.guessed_word_list[index] = button.letter
-                self.guessed_word = self.get_guessed_word()
-                self.letters_remaining -= 1
-        elif self.current_step <= 11:
-            self.current_step += 1
+        if self.state.check_letter(button.letter):
+            self.update_guessed_word_surface()
+        else:
+            self.hangman_surface = self.images[self.current_step]
+            self.mark_dirty(self.hangman_rect)
 
+    @profiler.timed("draw_content")
     def draw_content(self) -> None:
-        """Rysuje całą zwartość gry."""
-        self.screen.fill(BG_COLOR)
-        self.hangman_surface = self.images[self.current_step]
-        self.screen.blit(self.hangman_surface, self.hangman_rect)
-        self.current_player_surface = self.player_font.render(
-            f"Tura gracza: {self.players[self.current_player].nickname}", True, "black")
-        self.screen.blit(self.current_player_surface, self.current_player_rect)
-        self.screen.blit(self.category_surface, self.category_rect)
-
-        self.guessed_word_surface = self.word_font.render(self.guessed_word, True, "black")
-        self.screen.blit(self.guessed_word_surface, self.guessed_word_rect)
+        """Rysuje zwartość gry.
+
+        W trybie dirty_rendering przerysowywane i odświeżane są tylko fragmenty ekranu z dirty_rects, więc klatka,
+        w której nic się nie zmieniło, nie kosztuje prawie nic. Czas rysowania klatki trafia do frame_time.
+        """
+        start = time.perf_counter()
+        if self.overlay is not None and self.show_overlay:
+            self.mark_dirty(*self.overlay.update())
+        if not self.dirty_rendering or self.needs_full_redraw:
+            self.screen.fill(BG_COLOR)
+            self.blit_content()
+            pygame.display.update()
+            self.needs_full_redraw = False
+            self.dirty_rects.clear()
+        elif self.dirty_rects:
+            for rect in self.dirty_rects:
+                self.screen.set_clip(rect)
+                self.screen.fill(BG_COLOR)
+                self.blit_content(rect)
+            self.screen.set_clip(None)
+            pygame.display.update(self.dirty_rects)
+            self.dirty_rects.clear()
+
+        self.frame_time = (time.perf_counter() - start) * 1000
+        self.total_frame_time += self.frame_time
+        self.frame_count += 1
+
+    def blit_content(self, area: pygame.Rect | None = None) -> None:
+        """Rysuje na ekranie elementy gry, które nachodzą na podany obszar.
+
+        Args:
+            area: Obszar ekranu do przerysowania. Jeżeli None, rysowane są wszystkie elementy.
+
+        """
+        elements = [
+            (self.hangman_surface, self.hangman_rect),
+            (self.current_player_surface, self.current_player_rect),
+            (self.category_surface, self.category_rect),
+            (self.guessed_word_surface, self.guessed_word_rect),
+        ]
+        for surface, rect in elements:
+            if area is None or area.colliderect(rect):
+                self.screen.blit(surface, rect)
         for button in self.buttons:
-            button.draw()
+            if area is None or area.colliderect(button):
+                button.draw()
+        if self.overlay is not None and self.show_overlay:
+            self.overlay.draw(self.screen, area)
+
+    def mark_dirty(self, *rects: pygame.Rect) -> None:
+        """Oznacza fragmenty ekranu jako zmienione, aby zostały przerysowane w następnej klatce.
 
-        pygame.display.update()
+        Args:
+            rects: Prostokąty, które trzeba przerysować.
+
+        """
+        self.dirty_rects.extend(pygame.Rect(rect) for rect in rects)
+
+    def update_current_player_surface(self) -> None:
+        """Renderuje na nowo napis, kogo jest tura, i oznacza jego obszar jako zmieniony."""
+        old_rect = self.current_player_rect
+        self.current_player_surface = render_text(
+            f"Tura gracza: {self.players[self.current_player].nickname}", PLAYER_FONT_SIZE)
+        self.current_player_rect = self.current_player_surface.get_rect(midtop=(1100, 10))
+        self.mark_dirty(old_rect, self.current_player_rect)
+
+    def update_guessed_word_surface(self) -> None:
+        """Renderuje na nowo zgadywane słowo i oznacza jego obszar jako zmieniony."""
+        old_rect = self.guessed_word_rect
+        self.guessed_word_surface = render_text(self.guessed_word, WORD_FONT_SIZE)
+        self.guessed_word_rect = self.guessed_word_surface.get_rect(topleft=(40, 750))
+        self.mark_dirty(old_rect, self.guessed_word_rect)
+
+    def get_average_frame_time(self) -> float:
+        """Zwraca średni czas rysowania klatki.
+
+        Returns:
+            Średni czas rysowania klatki w milisekundach.
+        """
+        if self.frame_count == 0:
+            return 0.0
+        return self.total_frame_time / self.frame_count
 
     def load_buttons(self) -> None:
         """Inicjuje wszysktie przyciski z literami do atrybutu buttons."""
         horizontal_offset = 200
         vertical_offset = 100
-        alphabet_letter_number = 0
-        for i in range(8):
-            for j in range(4):
-                self.buttons.append(Button(800 + (j * horizontal_offset), 100 + (i * vertical_offset), 50, 50,
-                                           ALPHABET[alphabet_letter_number], self.screen))
-                alphabet_letter_number += 1
+        for alphabet_letter_number, letter in enumerate(ALPHABET):
+            i, j = divmod(alphabet_letter_number, BUTTON_COLUMNS)
+            self.buttons.append(Button(800 + (j * horizontal_offset), 100 + (i * vertical_offset), 50, 50,
+                                       letter, self.screen))
 
     def get_guessed_word(self) -> str:
         """Zamienia atrybut guessed_word _list na napis
@@ -210,42 +339,63 @@ class Game:
         Returns:
             Zgadywane słowo z brakującymi literami w postaci "_" jako napis.
         """
-        result = ""
-        for letter in self.guessed_word_list:
-            result += letter
-            result += " "
-        return result
+        return self.state.get_guessed_word()
 
+    @profiler.timed("check_finish")
     def check_finish(self) -> None:
         """Sprawdza czy gra się skończyła.
 
         Po ygranej funckaj dodaje zwycięzscy +1 do wyników.
         """
-        if self.current_step == 10:
+        if self.is_running and self.state.check_finish():
+            self.update_current_player_surface()
             self.is_running = False
-            self.winner = self.players[self.current_player]
-            self.winner.add_win()
-            messagebox.showinfo("Gratulacje", f"Wygrał gracz: {self.winner.nickname}")
-        elif self.letters_remaining <= 0:
-            self.change_player()
-            self.is_running = False
-            self.winner = self.players[self.current_player]
             self.winner.add_win()
             messagebox.showinfo("Gratulacje", f"Wygrał gracz: {self.winner.nickname}")
 
     def change_player(self) -> None:
         """Zmienia turę gracza."""
-        if self.current_player == 0:
-            self.current_player = 1
-        elif self.current_player == 1:
-            self.current_player = 0
-
-    def pick_category_and_word(self) -> tuple[Type[Category] | None, Type[Word] | None]:
-        """Losuje z bazy danych kategorię oraz związane z nią słowo.
+        self.state.change_player()
+        self.update_current_player_surface()
+
+    @property
+    def current_step(self) -> int:
+        """Obecny stan wisielca 0 - 10."""
+        return self.state.current_step
+
+    @property
+    def current_player(self) -> int:
+        """Indeks obecnego gracza (z listy players)."""
+        return self.state.current_player
+
+    @property
+    def letters_remaining(self) -> int:
+        """Liczba liter, kórych brakuje do zgadnięcia słowa."""
+        return self.state.letters_remaining
+
+    @property
+    def guessed_word_list(self) -> list[str]:
+        """Reprezentacja zgadniętych liter, w przypadku niezgadniętych jest "_"."""
+        return self.state.guessed_word_list
+
+    @property
+    def guessed_word(self) -> str:
+        """Reprezentacja guessed_word_list w postaci napisu."""
+        return self.state.guessed_word
+
+    @property
+    def winner(self) -> Player | None:
+        """Zwycięzca albo None, jeżeli gra trwa."""
+        return self.state.winner
+
+    @staticmethod
+    @profiler.timed("pick_word")
+    def pick_category_and_word() -> tuple[Category, Word]:
+        """Losuje kategorię oraz związane z nią słowo ze słownika w pamięci, bez zapytań do bazy danych.
 
         Returns:
-            Kategoria oraz związane z nią słowo.
+            Kategoria oraz związane z nią słowo (obiekty niezwiązane z sesją).
         """
-        category = self.session.query(Category).order_by(func.random()).first()
-        word = self.session.query(Word).filter_by(category_id=category.id).order_by(func.random()).first()
-        return category, word
+        picked = word_picker.picker.pick_word()
+        return (Category(id=picked.category_id, name=picked.category),
+                Word(id=picked.word_id, word=picked.word, category_id=picked.category_id))
@@ -0,0 +1,148 @@
+"""Moduł zawiera zasady gry w wisielca, niezależne od renderowania i bazy danych.
+
+Klasa GameState nie korzysta z pygame, więc może działać bez okna - w symulacjach albo na serwerze.
+
+Attributes:
+    ALPHABET (str): Polski alfabet.
+    MAX_STEP (int): Stan wisielca, przy którym gra się kończy.
+
+"""
+from typing import Any, Sequence
+
+ALPHABET = "AĄBCĆDEĘFGHIJKLŁMNŃOÓPRSŚTUWYZŻŹ"
+MAX_STEP = 10
+
+
+def find_indexes(letter: str, text: str) -> list[int]:
+    """Znajduje wszystkie indeksy, na których znajduję się konkretny znak w napisie.
+
+    Args:
+        letter: Litera, kórej występowania szukamy.
+        text: Napisa, w którym występowań litery szukamy.
+
+    Returns:
+        Lista indeksów, na których znajduję się dany znak w napisie.
+
+    """
+    indexes = []
+    for i, char in enumerate(text):
+        if char == letter:
+            indexes.append(i)
+    return indexes
+
+
+class GameState:
+    """Klasa reprezentuje stan rozgrywki: zgadnięte litery, stan wisielca, turę i zwycięzcę.
+
+    Args:
+        word: Zgadywane słowo.
+        players: Gracze biorący udział w rozgrywce - dowolne obiekty, np. Player albo pseudonimy.
+
+    Attributes:
+        word_string (str): Zgadywane słowo w postaci napisu, wielkimi literami.
+        players (Sequence): Gracze biorący udział w rozgrywce.
+        current_player (int): Indeks obecnego gracza (z listy players).
+        current_step (int): Obecny stan wisielca 0 - 10.
+        letters_remaining (int): Liczba liter, kórych brakuje do zgadnięcia słowa.
+        guessed_word_list (list[str]): Reprezentacja zgadniętych liter, w przypadku niezgadniętych jest "_".
+        guessed_word (str): Reprezentacja guessed_word_list w postaci napisu.
+        winner: Zwycięzca (jeden z players) albo None, jeżeli gra trwa.
+        letter_positions (dict[str, list[int]]): Indeksy jeszcze nieodkrytych liter słowa, według litery.
+        revealed_letters (set[str]): Litery słowa, które zostały już odkryte.
+        wrong_letters (set[str]): Podane litery, których nie ma w słowie.
+
+    """
+    __slots__ = ("word_string", "players", "current_player", "current_step", "letters_remaining", "guessed_word_list",
+                 "guessed_word", "winner", "letter_positions", "revealed_letters", "wrong_letters")
+
+    def __init__(self, word: str, players: Sequence[Any] = (0, 1)) -> None:
+        self.word_string = word.upper()
+        self.players = players
+        self.current_player = 0
+        self.current_step = 0
+        self.letters_remaining = len(self.word_string)
+        self.guessed_word_list = ["_" for _ in range(self.letters_remaining)]
+        self.guessed_word = self.get_guessed_word()
+        self.winner = None
+
+        self.letter_positions = {}
+        for i, letter in enumerate(self.word_string):
+            self.letter_positions.setdefault(letter, []).append(i)
+        self.revealed_letters = set()
+        self.wrong_letters = set()
+
+    def guess(self, letter: str) -> bool:
+        """Wykonuje pełny ruch gracza: sprawdza literę i przekazuje turę.
+
+        Args:
+            letter: Litera wybrana przez gracza.
+
+        Returns:
+            Prawda, jeżeli litera jest w słowie.
+
+        """
+        is_hit = self.check_letter(letter)
+        self.change_player()
+        return is_hit
+
+    def check_letter(self, letter: str) -> bool:
+        """Sprawdza, czy litera jest w słowie. Jeżeli nie, to wisielec przechodzi do następnego stanu.
+
+        Koszt jest proporcjonalny do liczby wystąpień litery - jej pozycje są wyliczone raz, przy tworzeniu stanu.
+        Ponowne podanie odkrytej już litery niczego nie zmienia.
+
+        Args:
+            letter: Sprawdzana litera.
+
+        Returns:
+            Prawda, jeżeli litera jest w słowie.
+
+        """
+        positions = self.letter_positions.pop(letter, None)
+        if positions is not None:
+            for index in positions:
+                self.guessed_word_list[index] = letter
+            self.letters_remaining -= len(positions)
+            self.revealed_letters.add(letter)
+            self.guessed_word = self.get_guessed_word()
+            return True
+        if letter in self.revealed_letters:
+            return True
+        self.wrong_letters.add(letter)
+        if self.current_step < MAX_STEP:
+            self.current_step += 1
+        return False
+
+    def get_guessed_word(self) -> str:
+        """Zamienia atrybut guessed_word _list na napis
+
+        Returns:
+            Zgadywane słowo z brakującymi literami w postaci "_" jako napis.
+        """
+        return "".join(letter + " " for letter in self.guessed_word_list)
+
+    def check_finish(self) -> bool:
+        """Sprawdza czy gra się skończyła i ustala zwycięzcę.
+
+        Gdy wisielec zostanie narysowany, wygrywa gracz, który ma turę. Gdy słowo zostanie zgadnięte, wygrywa gracz,
+        który odgadł ostatnią literę.
+
+        Returns:
+            Prawda, jeżeli gra się skończyła.
+
+        """
+        if self.winner is not None:
+            return True
+        if self.current_step >= MAX_STEP:
+            self.winner = self.players[self.current_player]
+        elif self.letters_remaining <= 0:
+            self.change_player()
+            self.winner = self.players[self.current_player]
+        return self.winner is not None
+
+    def change_player(self) -> None:
+        """Zmienia turę gracza."""
+        if self.current_player == 0:
+            self.current_player = 1
+        elif self.current_player == 1:
+            self.current_player = 0
@@ -0,0 +1,246 @@
+"""Moduł zawiera import dużych słowników słów i kategorii do bazy danych.
+
+Pliki są czytane strumieniowo, słowa są normalizowane do alfabetu gry i deduplikowane, a następnie wstawiane
+paczkami przez executemany w osobnych transakcjach, z włączonym trybem WAL.
+
+Obsługiwane formaty:
+    csv: Kolumny "word" i opcjonalnie "category".
+    jsonl: Obiekty z kluczami "word" i opcjonalnie "category", po jednym w linii.
+    txt: Jedno słowo w linii; kategorię trzeba podać parametrem.
+
+Przykład użycia z linii poleceń::
+
+    python importer.py slownik.txt --category Nauka
+
+Attributes:
+    BATCH_SIZE (int): Liczba słów wstawianych w jednej transakcji.
+    MAX_WORD_LENGTH (int): Maksymalna długość słowa (rozmiar kolumny word).
+
+"""
+import argparse
+import csv
+import json
+import time
+from typing import Callable, Iterator, NamedTuple
+
+import dictionary
+from database import engine
+from db_initialize import Base, bump_dictionary_version, migrate_schema
+from game_state import ALPHABET
+
+BATCH_SIZE = 10000
+MAX_WORD_LENGTH = 50
+
+
+class ImportResult(NamedTuple):
+    """Wynik importu słownika.
+
+    Attributes:
+        inserted (int): Liczba wstawionych słów.
+        skipped (int): Liczba pominiętych słów - niepoprawnych lub zduplikowanych.
+        seconds (float): Czas trwania importu w sekundach.
+
+    """
+    inserted: int
+    skipped: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Liczba wstawionych słów na sekundę."""
+        return self.inserted / self.seconds if self.seconds > 0 else 0.0
+
+
+def normalize_word(word: str) -> str | None:
+    """Normalizuje słowo do postaci zapisywanej w bazie danych.
+
+    Args:
+        word: Słowo do znormalizowania.
+
+    Returns:
+        Słowo z wielkiej litery albo None, jeżeli zawiera znaki spoza alfabetu gry lub ma złą długość.
+
+    """
+    word = word.strip()
+    if not word or len(word) > MAX_WORD_LENGTH:
+        return None
+    if any(letter not in ALPHABET for letter in word.upper()):
+        return None
+    return word.capitalize()
+
+
+def detect_format(path: str) -> str:
+    """Rozpoznaje format pliku po jego rozszerzeniu.
+
+    Args:
+        path: Ścieżka do pliku.
+
+    Returns:
+        Nazwa formatu: "csv", "jsonl" albo "txt".
+
+    """
+    extension = path.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        return "csv"
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    return "txt"
+
+
+def read_entries(path: str, file_format: str, category: str | None = None) -> Iterator[tuple[str, str]]:
+    """Czyta strumieniowo pary (kategoria, słowo) z pliku.
+
+    Args:
+        path: Ścieżka do pliku.
+        file_format: Format pliku: "csv", "jsonl" albo "txt".
+        category: Kategoria używana, gdy wiersz jej nie zawiera.
+
+    Yields:
+        Nazwa kategorii i surowe słowo.
+
+    Raises:
+        ValueError: Jeżeli wiersz nie ma kategorii, a nie podano kategorii domyślnej.
+
+    """
+    with open(path, encoding="utf-8", newline="") as file:
+        if file_format == "csv":
+            rows = ((row.get("category"), row.get("word")) for row in csv.DictReader(file))
+        elif file_format == "jsonl":
+            rows = ((entry.get("category"), entry.get("word")) for entry in map(json.loads, filter(str.strip, file)))
+        else:
+            rows = ((None, line) for line in file)
+
+        for row_category, word in rows:
+            row_category = (row_category or category or "").strip()
+            if not row_category:
+                raise ValueError(f"Brak kategorii dla słowa {word!r} - podaj kategorię domyślną.")
+            yield row_category, word or ""
+
+
+def import_words(path: str, file_format: str | None = None, category: str | None = None,
+                 batch_size: int = BATCH_SIZE, progress: Callable[[int], None] | None = None,
+                 update_difficulty: bool = True) -> ImportResult:
+    """Importuje słowa z pliku do bazy danych, tworząc brakujące kategorie.
+
+    Słowa są zatwierdzane paczkami. Jeżeli import przerwie błąd, wstawione już paczki pozostają w bazie, a wersja
+    słownika i trudność słów są mimo to aktualizowane.
+
+    Args:
+        path: Ścieżka do pliku.
+        file_format: Format pliku. Domyślnie rozpoznawany po rozszerzeniu.
+        category: Kategoria domyślna dla wierszy bez kategorii.
+        batch_size: Liczba słów wstawianych w jednej transakcji.
+        progress: Funkcja wywoływana po każdej paczce z dotychczasową liczbą wstawionych słów.
+        update_difficulty: Prawda, jeżeli po imporcie ma zostać przeliczona trudność wszystkich słów (wymaga NumPy).
+
+    Returns:
+        Wynik importu.
+
+    Raises:
+        ValueError: Jeżeli wiersz nie ma kategorii, a nie podano kategorii domyślnej.
+
+    """
+    start = time.perf_counter()
+    Base.metadata.create_all(engine)
+    migrate_schema()
+    inserted = 0
+    skipped = 0
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("SELECT name, id FROM category")
+        categories = dict(cursor.fetchall())
+        cursor.execute("SELECT category_id, word FROM word")
+        seen = {(category_id, word.upper()) for category_id, word in cursor.fetchall()}
+
+        batch = []
+        for category_name, raw_word in read_entries(path, file_format or detect_format(path), category):
+            word = normalize_word(raw_word)
+            if word is None:
+                skipped += 1
+                continue
+
+            category_id = categories.get(category_name)
+            if category_id is None:
+                cursor.execute("INSERT INTO category (name) VALUES (?)", (category_name,))
+                category_id = categories[category_name] = cursor.lastrowid
+
+            key = (category_id, word.upper())
+            if key in seen:
+                skipped += 1
+                continue
+            seen.add(key)
+
+            batch.append((word, category_id))
+            if len(batch) >= batch_size:
+                inserted += insert_batch(connection, batch)
+                if progress:
+                    progress(inserted)
+
+        inserted += insert_batch(connection, batch)
+        if progress:
+            progress(inserted)
+    finally:
+        connection.close()
+        # Paczki są zatwierdzane na bieżąco, więc także po błędzie w dalszej części pliku słownik się zmienił.
+        if inserted:
+            finish_import(update_difficulty)
+
+    return ImportResult(inserted, skipped, time.perf_counter() - start)
+
+
+def finish_import(update_difficulty: bool) -> None:
+    """Ogłasza zmianę słownika po wstawieniu słów i opcjonalnie przelicza trudność wszystkich słów.
+
+    Args:
+        update_difficulty: Prawda, jeżeli ma zostać przeliczona trudność wszystkich słów.
+
+    """
+    with engine.begin() as connection:
+        bump_dictionary_version(connection)
+    dictionary.cache.invalidate()
+
+    if update_difficulty:
+        import difficulty
+        difficulty.update_scores()
+
+
+def insert_batch(connection, batch: list[tuple[str, int]]) -> int:
+    """Wstawia paczkę słów w jednej transakcji i opróżnia listę.
+
+    Args:
+        connection: Połączenie DBAPI z bazą danych.
+        batch: Lista par (słowo, id kategorii).
+
+    Returns:
+        Liczba wstawionych słów.
+
+    """
+    count = len(batch)
+    if count:
+        connection.cursor().executemany("INSERT INTO word (word, category_id) VALUES (?, ?)", batch)
+    connection.commit()
+    batch.clear()
+    return count
+
+
+def main() -> None:
+    """Uruchamia import z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Import słownika do bazy danych wisielca.")
+    parser.add_argument("path", help="Plik ze słowami (.csv, .jsonl lub tekstowy).")
+    parser.add_argument("--format", choices=["csv", "jsonl", "txt"], help="Format pliku.")
+    parser.add_argument("--category", help="Kategoria dla słów bez kategorii.")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Liczba słów w jednej transakcji.")
+    parser.add_argument("--no-difficulty", action="store_true", help="Nie przeliczaj trudności słów po imporcie.")
+    args = parser.parse_args()
+
+    result = import_words(args.path, args.format, args.category, args.batch_size,
+                          progress=lambda count: print(f"Wstawiono {count} słów...", flush=True),
+                          update_difficulty=not args.no_difficulty)
+    print(f"Zaimportowano {result.inserted} słów, pominięto {result.skipped} "
+          f"w {result.seconds:.2f} s ({result.rows_per_second:.0f} słów/s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Moduł zawiera ranking graczy wczytywany stronami, bez wczytywania całej tabeli Player do pamięci.
+
+Strony są pobierane paginacją kluczową (keyset) po indeksie kolumny BestScore: gracze są posortowani malejąco według
+wyniku, a przy remisie malejąco według id, i każda kolejna strona zaczyna się za ostatnim graczem poprzedniej, więc
+koszt pobrania strony nie zależy od tego, jak głęboko gracz przewinął ranking.
+
+Miejsce gracza to 1 + liczba graczy z wyższym wynikiem (gracze z tym samym wynikiem zajmują to samo miejsce).
+
+Attributes:
+    PAGE_SIZE (int): Domyślna liczba graczy na stronie.
+
+"""
+from typing import NamedTuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import aliased
+
+from database import engine
+from db_initialize import Player
+
+PAGE_SIZE = 50
+
+
+class LeaderboardEntry(NamedTuple):
+    """Wiersz rankingu.
+
+    Attributes:
+        rank (int): Miejsce gracza.
+        id_player (int): Identyfikator gracza.
+        nickname (str): Pseudonim gracza.
+        best_score (int): Liczba wygranych gracza.
+
+    """
+    rank: int
+    id_player: int
+    nickname: str
+    best_score: int
+
+
+def escape_like(text: str) -> str:
+    """Zabezpiecza znaki specjalne wzorca LIKE.
+
+    Args:
+        text: Szukany tekst.
+
+    Returns:
+        Tekst z poprzedzonymi znakiem "\\" znakami "\\", "%" i "_".
+
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class Leaderboard:
+    """Klasa reprezentuje ranking graczy przeglądany kolejnymi stronami.
+
+    Przy przeglądaniu całego rankingu miejsca są wyliczane z pozycji gracza w kolejności rankingu, ciągłej pomiędzy
+    stronami. Przy wyszukiwaniu po pseudonimie pasujący gracze nie tworzą ciągłego fragmentu rankingu, więc ich
+    miejsca są liczone zapytaniem COUNT po indeksie BestScore.
+
+    Args:
+        search: Fragment pseudonimu gracza (bez rozróżniania wielkości liter). None lub pusty - wszyscy gracze.
+        page_size: Liczba graczy na stronie.
+
+    Attributes:
+        search (str | None): Fragment szukanego pseudonimu.
+        page_size (int): Liczba graczy na stronie.
+        last_entry (LeaderboardEntry | None): Ostatni pobrany wiersz - początek następnej strony.
+        position (int): Liczba pobranych dotąd wierszy.
+        exhausted (bool): Prawda, jeżeli pobrano już wszystkie wiersze.
+
+    """
+
+    def __init__(self, search: str | None = None, page_size: int = PAGE_SIZE) -> None:
+        self.search = search or None
+        self.page_size = page_size
+        self.last_entry = None
+        self.position = 0
+        self.exhausted = False
+
+    def next_page(self) -> list[LeaderboardEntry]:
+        """Pobiera następną stronę rankingu.
+
+        Returns:
+            Wiersze rankingu; pusta lista, jeżeli pobrano już wszystkie.
+
+        """
+        if self.exhausted:
+            return []
+
+        query = (select(Player.id_player, Player.nickname, Player.best_score)
+                 .order_by(Player.best_score.desc(), Player.id_player.desc())
+                 .limit(self.page_size))
+        if self.last_entry is not None:
+            query = query.where(tuple_(Player.best_score, Player.id_player)
+                                < tuple_(self.last_entry.best_score, self.last_entry.id_player))
+        if self.search:
+            better = aliased(Player)
+            higher_count = (select(func.count())
+                            .where(better.best_score > Player.best_score)
+                            .scalar_subquery())
+            query = (query.add_columns(higher_count)
+                     .where(Player.nickname.ilike(f"%{escape_like(self.search)}%", escape="\\")))
+
+        with engine.connect() as connection:
+            rows = connection.execute(query).all()
+
+        entries = []
+        for id_player, nickname, best_score, *higher in rows:
+            self.position += 1
+            if self.search:
+                rank = higher[0] + 1
+            elif self.last_entry is not None and self.last_entry.best_score == best_score:
+                rank = self.last_entry.rank
+            else:
+                rank = self.position
+            self.last_entry = LeaderboardEntry(rank, id_player, nickname, best_score)
+            entries.append(self.last_entry)
+        if len(rows) < self.page_size:
+            self.exhausted = True
+        return entries
+
@@ -1,7 +1,45 @@
-"""Główny moduł programu"""
+"""Główny moduł programu
+
+Menu główne jest wyświetlane zanim zostaną zaimportowane moduły bazy danych, a baza jest inicjalizowana dopiero po jego
+pojawieniu się. Opcja --startup-times wypisuje czasy poszczególnych etapów uruchamiania (pełne drzewo importów można
+zobaczyć, uruchamiając program z opcją interpretera -X importtime).
+
+"""
+import argparse
+import time
+
+
+def main() -> None:
+    """Uruchamia aplikację."""
+    parser = argparse.ArgumentParser(description="Wisielec.")
+    parser.add_argument("--startup-times", action="store_true", help="Wypisz czasy etapów uruchamiania.")
+    args = parser.parse_args()
+
+    timings = []
+    start = last = time.perf_counter()
+
+    def measure(stage: str) -> None:
+        nonlocal last
+        now = time.perf_counter()
+        timings.append((stage, now - last))
+        last = now
+
+    from windows import StartWindow
+    measure("import windows (tkinter)")
+    window = StartWindow()
+    window.update()
+    measure("wyświetlenie menu")
+    import db_initialize
+    measure("import bazy danych (SQLAlchemy)")
+    window.initialize_database()
+    measure("inicjalizacja bazy danych")
+
+    if args.startup_times:
+        for stage, seconds in timings:
+            print(f"{stage:<35} {seconds * 1000:8.1f} ms")
+        print(f"{'razem':<35} {(last - start) * 1000:8.1f} ms")
+    window.mainloop()
 
-from windows import *
 
 if __name__ == "__main__":
-    elo = StartWindow()
-    elo.mainloop()
+    main()
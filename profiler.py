@@ -0,0 +1,309 @@
+"""Moduł zawiera opcjonalne pomiary czasu gorących ścieżek gry, z percentylami liczonymi w przesuwnym oknie.
+
+Pomiary są domyślnie wyłączone - funkcje oznaczone dekoratorem timed sprawdzają wtedy tylko jedną zmienną globalną.
+Włącza się je zmienną środowiskową WISIELEC_PROFILE=1 (albo funkcją enable). Gra pokazuje wtedy w lewym górnym
+rogu nakładkę z percentylami czasu klatki i poszczególnych sekcji (klawisz F3 ją ukrywa), a przy wyjściu z programu
+wypisuje podsumowanie. Jeżeli ustawiono WISIELEC_PROFILE_FILE, przez cały czas działania programu zbierany jest też
+profil cProfile, zapisywany do tego pliku przy wyjściu (do obejrzenia np. przez python -m pstats).
+
+Przykład użycia::
+
+    WISIELEC_PROFILE=1 WISIELEC_PROFILE_FILE=wisielec.prof python main.py
+
+Attributes:
+    WINDOW_SIZE (int): Liczba ostatnich pomiarów każdej sekcji, z których liczone są percentyle.
+    OVERLAY_INTERVAL (float): Co ile sekund odświeżana jest nakładka z wynikami.
+    OVERLAY_COLOR (tuple[int, int, int]): Kolor tekstu nakładki.
+    OVERLAY_BG_COLOR (tuple[int, int, int, int]): Kolor tła nakładki (RGBA).
+
+"""
+import atexit
+import cProfile
+import functools
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+WINDOW_SIZE = 600
+OVERLAY_INTERVAL = 0.25
+OVERLAY_COLOR = (255, 255, 255)
+OVERLAY_BG_COLOR = (0, 0, 0, 170)
+
+_active = None
+
+
+class RollingStats:
+    """Klasa przechowuje ostatnie pomiary jednej sekcji i liczy z nich percentyle.
+
+    Args:
+        window_size: Liczba przechowywanych pomiarów.
+
+    Attributes:
+        samples (collections.deque[float]): Ostatnie pomiary w milisekundach.
+        count (int): Liczba wszystkich pomiarów.
+        total (float): Suma wszystkich pomiarów w milisekundach.
+
+    """
+    __slots__ = ("samples", "count", "total")
+
+    def __init__(self, window_size: int = WINDOW_SIZE) -> None:
+        self.samples = deque(maxlen=window_size)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, milliseconds: float) -> None:
+        """Dodaje pomiar.
+
+        Args:
+            milliseconds: Zmierzony czas w milisekundach.
+
+        """
+        self.samples.append(milliseconds)
+        self.count += 1
+        self.total += milliseconds
+
+    def percentiles(self, *quantiles: float) -> list[float]:
+        """Liczy percentyle z pomiarów w oknie (metodą najbliższej rangi).
+
+        Args:
+            quantiles: Kwantyle 0 - 1, np. 0.5, 0.95, 0.99.
+
+        Returns:
+            Percentyle w milisekundach, w kolejności kwantyli (zera, jeżeli nie ma pomiarów).
+
+        """
+        if not self.samples:
+            return [0.0] * len(quantiles)
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return [ordered[min(last, int(quantile * len(ordered)))] for quantile in quantiles]
+
+
+class Profiler:
+    """Klasa zbiera pomiary czasu sekcji oraz opcjonalnie profil cProfile.
+
+    Args:
+        window_size: Liczba ostatnich pomiarów każdej sekcji, z których liczone są percentyle.
+        profile_path: Plik, do którego zapisywany jest profil cProfile. Jeżeli None, profil nie jest zbierany.
+
+    Attributes:
+        window_size (int): Liczba ostatnich pomiarów każdej sekcji.
+        stats (dict[str, RollingStats]): Pomiary według nazwy sekcji.
+        profile_path (str | None): Plik z profilem cProfile.
+        profile (cProfile.Profile | None): Zbierany profil cProfile.
+
+    """
+
+    def __init__(self, window_size: int = WINDOW_SIZE, profile_path: str | None = None) -> None:
+        self.window_size = window_size
+        self.stats = {}
+        self.profile_path = profile_path
+        self.profile = None
+
+    def record(self, section: str, milliseconds: float) -> None:
+        """Zapisuje pomiar sekcji.
+
+        Args:
+            section: Nazwa sekcji.
+            milliseconds: Zmierzony czas w milisekundach.
+
+        """
+        stats = self.stats.get(section)
+        if stats is None:
+            stats = self.stats[section] = RollingStats(self.window_size)
+        stats.add(milliseconds)
+
+    @contextmanager
+    def measure(self, section: str) -> Iterator[None]:
+        """Mierzy czas wykonania bloku with.
+
+        Args:
+            section: Nazwa sekcji.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(section, (time.perf_counter() - start) * 1000)
+
+    def start_profile(self) -> None:
+        """Zaczyna zbierać profil cProfile, jeżeli podano plik na profil."""
+        if self.profile_path and self.profile is None:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def stop_profile(self) -> None:
+        """Kończy zbierać profil cProfile i zapisuje go do pliku."""
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile.dump_stats(self.profile_path)
+            self.profile = None
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Zwraca podsumowanie pomiarów.
+
+        Returns:
+            Dla każdej sekcji liczba pomiarów, średnia oraz p50, p95 i p99 z okna, w milisekundach.
+
+        """
+        report = {}
+        for section, stats in sorted(self.stats.items()):
+            p50, p95, p99 = stats.percentiles(0.5, 0.95, 0.99)
+            report[section] = {"count": stats.count, "mean_ms": stats.total / stats.count,
+                               "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+        return report
+
+    def format_report(self) -> list[str]:
+        """Formatuje podsumowanie pomiarów do wyświetlenia.
+
+        Returns:
+            Linie tekstu, po jednej na sekcję.
+
+        """
+        return [f"{section:<16} p50 {row['p50_ms']:6.2f}  p95 {row['p95_ms']:6.2f}  p99 {row['p99_ms']:6.2f} ms"
+                for section, row in self.report().items()]
+
+
+def enable(profile_path: str | None = None, window_size: int = WINDOW_SIZE) -> Profiler:
+    """Włącza pomiary czasu w całym procesie.
+
+    Args:
+        profile_path: Plik, do którego przy wyjściu z programu zapisywany jest profil cProfile.
+        window_size: Liczba ostatnich pomiarów każdej sekcji, z których liczone są percentyle.
+
+    Returns:
+        Aktywny obiekt zbierający pomiary.
+
+    """
+    global _active
+    if _active is None:
+        _active = Profiler(window_size, profile_path)
+        _active.start_profile()
+        atexit.register(_finish)
+    return _active
+
+
+def disable() -> None:
+    """Wyłącza pomiary czasu i zapisuje profil cProfile, jeżeli był zbierany."""
+    global _active
+    if _active is not None:
+        _active.stop_profile()
+        _active = None
+        atexit.unregister(_finish)
+
+
+def get_profiler() -> Profiler | None:
+    """Zwraca aktywny obiekt zbierający pomiary.
+
+    Returns:
+        Aktywny obiekt albo None, jeżeli pomiary są wyłączone.
+
+    """
+    return _active
+
+
+def _finish() -> None:
+    """Wypisuje podsumowanie pomiarów i zapisuje profil cProfile przy wyjściu z programu."""
+    if _active is not None:
+        for line in _active.format_report():
+            print(line)
+        disable()
+
+
+def timed(section: str) -> Callable[[Callable], Callable]:
+    """Dekorator mierzący czas wywołań funkcji, gdy pomiary są włączone.
+
+    Args:
+        section: Nazwa sekcji, pod którą zapisywane są pomiary.
+
+    Returns:
+        Dekorator.
+
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _active.record(section, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+
+class Overlay:
+    """Klasa reprezentuje nakładkę z wynikami pomiarów rysowaną na ekranie gry.
+
+    Args:
+        profiler: Obiekt zbierający pomiary.
+        font: Czcionka tekstu nakładki (pygame.font.Font).
+        topleft: Położenie lewego górnego rogu nakładki.
+
+    Attributes:
+        profiler (Profiler): Obiekt zbierający pomiary.
+        font (pygame.font.Font): Czcionka tekstu nakładki.
+        topleft (tuple[int, int]): Położenie lewego górnego rogu nakładki.
+        surface (pygame.Surface | None): Ostatnio wyrenderowana nakładka.
+        rect (pygame.Rect | None): Obszar ekranu zajmowany przez nakładkę.
+        updated_at (float): Czas ostatniego odświeżenia nakładki (time.perf_counter).
+
+    """
+
+    def __init__(self, profiler: Profiler, font, topleft: tuple[int, int] = (0, 0)) -> None:
+        self.profiler = profiler
+        self.font = font
+        self.topleft = topleft
+        self.surface = None
+        self.rect = None
+        self.updated_at = 0.0
+
+    def update(self) -> list:
+        """Renderuje nakładkę na nowo, jeżeli minęło OVERLAY_INTERVAL od ostatniego odświeżenia.
+
+        Returns:
+            Prostokąty ekranu do przerysowania - stary i nowy obszar nakładki (pusta lista, jeżeli nie odświeżono).
+
+        """
+        import pygame
+
+        now = time.perf_counter()
+        if self.surface is not None and now - self.updated_at < OVERLAY_INTERVAL:
+            return []
+        self.updated_at = now
+
+        lines = [self.font.render(line, True, OVERLAY_COLOR) for line in self.profiler.format_report()]
+        if not lines:
+            return []
+        width = max(line.get_width() for line in lines) + 10
+        height = sum(line.get_height() for line in lines) + 10
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.surface.fill(OVERLAY_BG_COLOR)
+        y = 5
+        for line in lines:
+            self.surface.blit(line, (5, y))
+            y += line.get_height()
+
+        old_rect = self.rect
+        self.rect = self.surface.get_rect(topleft=self.topleft)
+        return [self.rect] if old_rect is None else [old_rect, self.rect]
+
+    def draw(self, screen, area=None) -> None:
+        """Rysuje nakładkę na ekranie.
+
+        Args:
+            screen: Ekran gry (pygame.Surface).
+            area: Przerysowywany obszar ekranu. Jeżeli None, nakładka jest rysowana zawsze.
+
+        """
+        if self.surface is not None and (area is None or area.colliderect(self.rect)):
+            screen.blit(self.surface, self.rect)
+
+
+if os.environ.get("WISIELEC_PROFILE") == "1":
+    enable(os.environ.get("WISIELEC_PROFILE_FILE"))
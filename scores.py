@@ -0,0 +1,100 @@
+"""Moduł zawiera kolejkowany zapis wygranych dla wielu równolegle trwających gier.
+
+Attributes:
+    FLUSH_INTERVAL (float): Maksymalny czas zbierania wygranych do jednej paczki, w sekundach.
+
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from db_initialize import record_wins
+
+FLUSH_INTERVAL = 0.05
+
+
+class WinRecorder:
+    """Klasa zbiera wygrane z wielu gier i zapisuje je w tle paczkami, jedną transakcją na paczkę.
+
+    Wygrane tego samego gracza z jednej paczki są sumowane w jedno zapytanie UPDATE.
+
+    Args:
+        flush_interval: Maksymalny czas zbierania wygranych do jednej paczki, w sekundach.
+
+    Attributes:
+        flush_interval (float): Maksymalny czas zbierania wygranych do jednej paczki, w sekundach.
+        queue (queue.Queue): Kolejka wygranych oczekujących na zapis.
+        thread (threading.Thread): Wątek zapisujący wygrane.
+
+    """
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL) -> None:
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name="WinRecorder", daemon=True)
+        self.thread.start()
+
+    def add_win(self, id_player: int) -> Future:
+        """Dodaje wygraną gracza do kolejki.
+
+        Args:
+            id_player: Identyfikator gracza.
+
+        Returns:
+            Future z nową liczbą wygranych gracza (None, jeżeli gracza nie ma w bazie danych).
+
+        """
+        future = Future()
+        self.queue.put((id_player, future))
+        return future
+
+    def run(self) -> None:
+        """Pętla wątku zapisującego - zbiera wygrane w paczki i zapisuje je do bazy danych."""
+        is_running = True
+        while is_running:
+            batch = []
+            item = self.queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while item is not None:
+                batch.append(item)
+                try:
+                    item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            else:
+                is_running = False
+
+            if batch:
+                self.flush(batch)
+
+    def flush(self, batch: list[tuple[int, Future]]) -> None:
+        """Zapisuje paczkę wygranych i przekazuje wyniki do obiektów Future.
+
+        Args:
+            batch: Lista par (id gracza, Future).
+
+        """
+        wins = {}
+        for id_player, _ in batch:
+            wins[id_player] = wins.get(id_player, 0) + 1
+
+        try:
+            best_scores = record_wins(wins)
+        except Exception as error:
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        for id_player, future in batch:
+            best_score = best_scores.get(id_player)
+            if best_score is not None:
+                # Każda wygrana dostaje wynik po swoim własnym zwiększeniu, w kolejności dodania do kolejki.
+                wins[id_player] -= 1
+                best_score -= wins[id_player]
+            future.set_result(best_score)
+
+    def close(self) -> None:
+        """Zapisuje pozostałe w kolejce wygrane i kończy wątek zapisujący."""
+        self.queue.put(None)
+        self.thread.join()
@@ -0,0 +1,420 @@
+"""Moduł zawiera serwer gry sieciowej (asyncio, TCP) obsługujący wiele pokoi jednocześnie oraz klienta testu obciążenia.
+
+Każdy pokój łączy dwóch zalogowanych graczy i korzysta z silnika GameState. Komunikaty to obiekty JSON, po jednym
+w linii.
+
+Klient wysyła:
+    {"type": "login", "nickname": ..., "password": ...}: Logowanie (bez hasła, jeżeli serwer przyjmuje gości).
+    {"type": "guess", "letter": ...}: Strzał litery w swojej turze.
+
+Serwer wysyła:
+    {"type": "logged_in"}, {"type": "waiting"}: Potwierdzenie logowania i oczekiwanie na przeciwnika.
+    {"type": "start", ...}, {"type": "state", ...}: Stan gry - wzorzec, stan wisielca, użyte litery, czyja tura.
+    {"type": "finish", ...}: Koniec gry ze zwycięzcą i słowem.
+    {"type": "error", "message": ...}: Błąd.
+
+Przykład użycia z linii poleceń::
+
+    python server.py serve --port 8765
+    python server.py loadtest --port 8765 --rooms 1000
+
+Attributes:
+    HOST (str): Domyślny adres serwera.
+    PORT (int): Domyślny port serwera.
+    MAX_LINE (int): Maksymalna długość komunikatu w bajtach.
+
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+
+from auth import auth_service
+from dictionary import load_dictionary
+from game_state import ALPHABET, GameState
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_LINE = 1024
+
+
+class Client:
+    """Klasa reprezentuje połączonego klienta.
+
+    Args:
+        reader: Strumień odczytu połączenia.
+        writer: Strumień zapisu połączenia.
+
+    Attributes:
+        reader (asyncio.StreamReader): Strumień odczytu połączenia.
+        writer (asyncio.StreamWriter): Strumień zapisu połączenia.
+        nickname (str | None): Pseudonim zalogowanego gracza.
+        player (Player | None): Gracz z bazy danych albo None dla gościa.
+        room (Room | None): Pokój, w którym klient gra.
+
+    """
+    __slots__ = ("reader", "writer", "nickname", "player", "room")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.nickname = None
+        self.player = None
+        self.room = None
+
+    async def send(self, message: dict) -> None:
+        """Wysyła komunikat do klienta.
+
+        Args:
+            message: Komunikat.
+
+        """
+        if self.writer.is_closing():
+            return
+        self.writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass
+
+
+class Room:
+    """Klasa reprezentuje pokój z jedną rozgrywką dwóch graczy.
+
+    Args:
+        room_id: Identyfikator pokoju.
+        clients: Dwaj gracze.
+        category: Kategoria zgadywanego słowa.
+        word: Zgadywane słowo.
+        difficulty: Poziom trudności: 0 - klasyczny, 1 - hradcore.
+
+    Attributes:
+        room_id (int): Identyfikator pokoju.
+        category (str): Kategoria zgadywanego słowa.
+        state (GameState): Stan rozgrywki; graczami są obiekty Client.
+        difficulty (int): Poziom trudności: 0 - klasyczny, 1 - hradcore.
+        used_letters (set[str]): Litery podane w tej rozgrywce.
+
+    """
+    __slots__ = ("room_id", "category", "state", "difficulty", "used_letters")
+
+    def __init__(self, room_id: int, clients: list[Client], category: str, word: str, difficulty: int) -> None:
+        self.room_id = room_id
+        self.category = category
+        self.state = GameState(word, clients)
+        self.difficulty = difficulty
+        self.used_letters = set()
+
+    async def broadcast_state(self, message_type: str, **extra) -> None:
+        """Wysyła obu graczom aktualny stan gry. Po zakończeniu gry żaden z graczy nie ma tury.
+
+        Args:
+            message_type: Typ komunikatu.
+            extra: Dodatkowe pola komunikatu.
+
+        """
+        state = self.state
+        for i, client in enumerate(state.players):
+            await client.send({
+                "type": message_type,
+                "room": self.room_id,
+                "category": self.category,
+                "pattern": state.guessed_word,
+                "step": state.current_step,
+                "used": "" if self.difficulty else "".join(sorted(self.used_letters)),
+                "turn": state.players[state.current_player].nickname,
+                "your_turn": state.winner is None and i == state.current_player,
+                **extra,
+            })
+
+    async def guess(self, client: Client, letter: str) -> bool:
+        """Obsługuje strzał gracza.
+
+        Args:
+            client: Gracz, który strzela.
+            letter: Podana litera.
+
+        Returns:
+            Prawda, jeżeli gra skończyła się tym strzałem.
+
+        """
+        state = self.state
+        if state.winner is not None:
+            await client.send({"type": "error", "message": "Gra jest zakończona."})
+            return False
+        if client is not state.players[state.current_player]:
+            await client.send({"type": "error", "message": "Nie twoja tura."})
+            return False
+        if len(letter) != 1 or letter not in ALPHABET:
+            await client.send({"type": "error", "message": "Niepoprawna litera."})
+            return False
+        if self.difficulty == 0 and letter in self.used_letters:
+            await client.send({"type": "error", "message": "Litera była już podana."})
+            return False
+
+        self.used_letters.add(letter)
+        is_hit = state.guess(letter)
+        finished = state.check_finish()
+        await self.broadcast_state("state", letter=letter, hit=is_hit)
+        if not finished:
+            return False
+
+        winner = state.winner
+        if winner.player is not None:
+            await asyncio.to_thread(winner.player.add_win)
+        for player in state.players:
+            await player.send({"type": "finish", "room": self.room_id, "winner": winner.nickname,
+                               "word": state.word_string})
+        return True
+
+
+class GameServer:
+    """Klasa reprezentuje serwer gry - przyjmuje połączenia, łączy graczy w pary i prowadzi pokoje.
+
+    Args:
+        difficulty: Poziom trudności we wszystkich pokojach: 0 - klasyczny, 1 - hradcore.
+        allow_guests: Prawda, jeżeli gracze mogą logować się bez konta (wygrane gości nie są zapisywane).
+        dictionary: Słowa w podziale na kategorie. Domyślnie wczytywane z bazy danych.
+
+    Attributes:
+        difficulty (int): Poziom trudności we wszystkich pokojach.
+        allow_guests (bool): Prawda, jeżeli gracze mogą logować się bez konta.
+        dictionary (dict[str, list[str]]): Słowa w podziale na kategorie.
+        categories (list[str]): Kategorie, z których losowane są słowa.
+        rooms (dict[int, Room]): Trwające rozgrywki.
+        clients (dict[str, Client]): Zalogowani klienci według pseudonimu.
+        waiting (Client | None): Gracz oczekujący na przeciwnika.
+        room_ids (itertools.count): Licznik identyfikatorów pokoi.
+        rng (random.Random): Generator liczb losowych.
+
+    """
+
+    def __init__(self, difficulty: int = 0, allow_guests: bool = False,
+                 dictionary: dict[str, list[str]] | None = None) -> None:
+        self.difficulty = difficulty
+        self.allow_guests = allow_guests
+        self.dictionary = dictionary if dictionary is not None else load_dictionary()
+        self.categories = sorted(self.dictionary)
+        self.rooms = {}
+        self.clients = {}
+        self.waiting = None
+        self.room_ids = itertools.count(1)
+        self.rng = random.Random()
+
+    async def serve(self, host: str = HOST, port: int = PORT) -> None:
+        """Uruchamia serwer i obsługuje połączenia do czasu przerwania.
+
+        Args:
+            host: Adres serwera.
+            port: Port serwera.
+
+        """
+        server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+        print(f"Serwer nasłuchuje na {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Obsługuje jedno połączenie od logowania do rozłączenia.
+
+        Args:
+            reader: Strumień odczytu połączenia.
+            writer: Strumień zapisu połączenia.
+
+        """
+        client = Client(reader, writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    await client.send({"type": "error", "message": "Niepoprawny komunikat."})
+                    continue
+
+                if message.get("type") == "login" and client.nickname is None:
+                    await self.login(client, message)
+                elif message.get("type") == "guess" and client.room is not None:
+                    room = client.room
+                    if await room.guess(client, str(message.get("letter", "")).upper()):
+                        self.close_room(room)
+                else:
+                    await client.send({"type": "error", "message": "Nieoczekiwany komunikat."})
+        finally:
+            await self.disconnect(client)
+
+    async def login(self, client: Client, message: dict) -> None:
+        """Loguje klienta i dołącza go do kolejki oczekujących na przeciwnika.
+
+        Gracz może być zalogowany tylko na jednym połączeniu naraz, więc nie może zagrać sam ze sobą.
+
+        Args:
+            client: Klient.
+            message: Komunikat logowania.
+
+        """
+        nickname = str(message.get("nickname", ""))
+        password = message.get("password")
+        if nickname in self.clients:
+            await client.send({"type": "error", "message": "Gracz jest już zalogowany."})
+            return
+        player = None
+        is_guest = password is None and self.allow_guests and bool(nickname)
+        if not is_guest:
+            player = await auth_service.login_async(nickname, str(password or ""))
+            if player is None:
+                await client.send({"type": "error", "message": "Błędny login lub hasło!"})
+                return
+            nickname = player.nickname
+        # Sprawdzenie powtórzone po logowaniu - inne połączenie mogło zalogować gracza w trakcie sprawdzania hasła.
+        if nickname in self.clients:
+            await client.send({"type": "error", "message": "Gracz jest już zalogowany."})
+            return
+        client.nickname = nickname
+        client.player = player
+        self.clients[nickname] = client
+
+        await client.send({"type": "logged_in"})
+        await self.match(client)
+
+    async def match(self, client: Client) -> None:
+        """Łączy klienta w parę z oczekującym graczem albo ustawia go jako oczekującego.
+
+        Args:
+            client: Zalogowany klient.
+
+        """
+        opponent = self.waiting
+        if opponent is None or opponent.writer.is_closing():
+            self.waiting = client
+            await client.send({"type": "waiting"})
+            return
+
+        self.waiting = None
+        category = self.rng.choice(self.categories)
+        room = Room(next(self.room_ids), [opponent, client], category, self.rng.choice(self.dictionary[category]),
+                    self.difficulty)
+        self.rooms[room.room_id] = room
+        opponent.room = client.room = room
+        await room.broadcast_state("start", players=[opponent.nickname, client.nickname])
+
+    def close_room(self, room: Room) -> None:
+        """Usuwa zakończony pokój.
+
+        Args:
+            room: Pokój do usunięcia.
+
+        """
+        self.rooms.pop(room.room_id, None)
+        for player in room.state.players:
+            player.room = None
+
+    async def disconnect(self, client: Client) -> None:
+        """Sprząta po rozłączonym kliencie i powiadamia jego przeciwnika.
+
+        Args:
+            client: Rozłączony klient.
+
+        """
+        if self.waiting is client:
+            self.waiting = None
+        if client.nickname is not None and self.clients.get(client.nickname) is client:
+            del self.clients[client.nickname]
+        room = client.room
+        if room is not None:
+            self.close_room(room)
+            for player in room.state.players:
+                if player is not client:
+                    await player.send({"type": "finish", "room": room.room_id, "winner": None,
+                                       "word": room.state.word_string, "reason": "opponent_left"})
+        client.writer.close()
+
+
+async def bot(host: str, port: int, nickname: str, rng: random.Random) -> bool:
+    """Gracz testu obciążenia - loguje się jako gość i strzela losowymi literami aż do końca gry.
+
+    Args:
+        host: Adres serwera.
+        port: Port serwera.
+        nickname: Pseudonim gościa.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Prawda, jeżeli gra zakończyła się normalnie.
+
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    tried = set()
+    try:
+        writer.write(json.dumps({"type": "login", "nickname": nickname}).encode("utf-8") + b"\n")
+        async for line in reader:
+            message = json.loads(line)
+            if message["type"] == "finish":
+                return message.get("reason") is None
+            if message["type"] == "error":
+                return False
+            if message.get("your_turn"):
+                letters = [letter for letter in ALPHABET if letter not in tried and letter not in message["used"]]
+                letter = rng.choice(letters)
+                tried.add(letter)
+                writer.write(json.dumps({"type": "guess", "letter": letter}).encode("utf-8") + b"\n")
+        return False
+    finally:
+        writer.close()
+
+
+async def load_test(host: str, port: int, rooms: int, seed: int = 0) -> dict[str, float]:
+    """Uruchamia równolegle rozgrywki botów na serwerze.
+
+    Args:
+        host: Adres serwera.
+        port: Port serwera (serwer musi przyjmować gości).
+        rooms: Liczba równoległych pokoi.
+        seed: Ziarno generatora liczb losowych.
+
+    Returns:
+        Liczba pokoi, liczba poprawnie zakończonych gier, czas trwania i liczba gier na sekundę.
+
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(bot(host, port, f"bot{i}", random.Random(rng.random()))
+                                     for i in range(2 * rooms)), return_exceptions=True)
+    seconds = time.perf_counter() - start
+    finished = sum(result is True for result in results) // 2
+    return {"rooms": rooms, "finished": finished, "seconds": seconds, "games_per_second": finished / seconds}
+
+
+def main() -> None:
+    """Uruchamia serwer albo test obciążenia z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Serwer gry sieciowej w wisielca.")
+    parser.add_argument("command", choices=["serve", "loadtest"], help="Uruchom serwer albo test obciążenia.")
+    parser.add_argument("--host", default=HOST, help="Adres serwera.")
+    parser.add_argument("--port", type=int, default=PORT, help="Port serwera.")
+    parser.add_argument("--difficulty", type=int, choices=[0, 1], default=0,
+                        help="Poziom trudności: 0 - klasyczny, 1 - hardcore.")
+    parser.add_argument("--guests", action="store_true", help="Pozwól grać gościom bez konta.")
+    parser.add_argument("--rooms", type=int, default=100, help="Liczba pokoi w teście obciążenia.")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        server = GameServer(args.difficulty, args.guests)
+        try:
+            asyncio.run(server.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    else:
+        result = asyncio.run(load_test(args.host, args.port, args.rooms))
+        print(f"Zakończono {result['finished']} z {result['rooms']} gier w {result['seconds']:.2f} s "
+              f"({result['games_per_second']:.0f} gier/s).")
+
+
+if __name__ == "__main__":
+    main()
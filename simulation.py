@@ -0,0 +1,275 @@
+"""Moduł zawiera wsadową symulację rozgrywek (Monte Carlo), służącą do strojenia poziomu trudności i list słów.
+
+Gry są rozgrywane bez okna, na silniku GameState, przez dwóch graczy korzystających z tej samej strategii
+zgadywania. Słowa są losowane tak jak w grze: najpierw kategoria, potem słowo z tej kategorii. Symulacja jest
+dzielona na paczki rozgrywane w puli procesów.
+
+W trybie klasycznym kliknięte przyciski znikają, więc obaj gracze pamiętają wszystkie podane litery. W trybie hardcore
+przyciski zostają, więc każdy gracz pamięta tylko swoje litery.
+
+Przykład użycia z linii poleceń::
+
+    python simulation.py 1000000 --strategy frequency --difficulty 0 1 --workers 8
+
+Attributes:
+    CHUNK_SIZE (int): Liczba gier rozgrywanych w jednym zadaniu puli procesów.
+    DIFFICULTY_NAMES (dict[int, str]): Nazwy poziomów trudności.
+    STRATEGIES (dict[str, Callable]): Dostępne strategie zgadywania.
+
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from dictionary import load_dictionary
+from game_state import ALPHABET, GameState
+from solver import WordIndex
+
+CHUNK_SIZE = 10000
+DIFFICULTY_NAMES = {0: "klasyczny", 1: "hardcore"}
+
+_dictionary: dict[str, list[str]] = {}
+_index: WordIndex | None = None
+_letter_order: list[str] = list(ALPHABET)
+
+
+def init_worker(dictionary: dict[str, list[str]]) -> None:
+    """Przygotowuje proces do symulacji - zapamiętuje słownik, buduje jego indeks i wylicza kolejność częstości liter.
+
+    Args:
+        dictionary: Słowa w podziale na kategorie.
+
+    """
+    global _dictionary, _index, _letter_order
+    _dictionary = dictionary
+    _index = WordIndex((category, word) for category, words in dictionary.items() for word in words)
+    letter_counts = Counter()
+    for words in dictionary.values():
+        for word in words:
+            letter_counts.update(set(word))
+    _letter_order = sorted(ALPHABET, key=lambda letter: -letter_counts[letter])
+
+
+def random_strategy(state: GameState, tried: set[str], category: str, rng: random.Random) -> str | None:
+    """Wybiera losową, jeszcze niepodaną literę.
+
+    Args:
+        state: Stan rozgrywki.
+        tried: Litery podane wcześniej przez gracza.
+        category: Kategoria zgadywanego słowa.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Wybrana litera albo None, jeżeli wszystkie litery zostały już podane.
+
+    """
+    letters = [letter for letter in ALPHABET if letter not in tried]
+    return rng.choice(letters) if letters else None
+
+
+def frequency_strategy(state: GameState, tried: set[str], category: str, rng: random.Random) -> str | None:
+    """Wybiera najczęstszą w całym słowniku, jeszcze niepodaną literę.
+
+    Args:
+        state: Stan rozgrywki.
+        tried: Litery podane wcześniej przez gracza.
+        category: Kategoria zgadywanego słowa.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Wybrana litera albo None, jeżeli wszystkie litery zostały już podane.
+
+    """
+    for letter in _letter_order:
+        if letter not in tried:
+            return letter
+    return None
+
+
+def optimal_strategy(state: GameState, tried: set[str], category: str, rng: random.Random) -> str | None:
+    """Wybiera literę, która najbardziej zawęża zbiór słów z kategorii pasujących do odkrytego wzorca (solver).
+
+    Args:
+        state: Stan rozgrywki.
+        tried: Litery podane wcześniej przez gracza.
+        category: Kategoria zgadywanego słowa.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Wybrana litera albo None, jeżeli wszystkie litery zostały już podane.
+
+    """
+    letter = _index.best_letter(state.guessed_word_list, tried - state.revealed_letters, category)
+    if letter is None:
+        return frequency_strategy(state, tried, category, rng)
+    return letter
+
+
+STRATEGIES: dict[str, Callable[[GameState, set[str], str, random.Random], str | None]] = {
+    "random": random_strategy,
+    "frequency": frequency_strategy,
+    "optimal": optimal_strategy,
+}
+
+
+def play_game(word: str, category: str, difficulty: int, strategy: Callable,
+              rng: random.Random) -> tuple[GameState, int]:
+    """Rozgrywa jedną grę do końca.
+
+    Args:
+        word: Zgadywane słowo.
+        category: Kategoria zgadywanego słowa.
+        difficulty: Poziom trudności: 0 - klasyczny, 1 - hradcore.
+        strategy: Strategia zgadywania obu graczy.
+        rng: Generator liczb losowych.
+
+    Returns:
+        Stan rozgrywki po jej zakończeniu oraz liczba wykonanych ruchów.
+
+    """
+    state = GameState(word)
+    shared = set()
+    tried = [shared, shared] if difficulty == 0 else [set(), set()]
+    turns = 0
+    while not state.check_finish():
+        player_tried = tried[state.current_player]
+        letter = strategy(state, player_tried, category, rng)
+        if letter is None:
+            break
+        player_tried.add(letter)
+        state.guess(letter)
+        turns += 1
+    return state, turns
+
+
+def simulate_chunk(games: int, strategy_name: str, difficulty: int, seed: int) -> dict[str, list[int]]:
+    """Rozgrywa paczkę gier i zwraca zagregowane wyniki.
+
+    Args:
+        games: Liczba gier.
+        strategy_name: Nazwa strategii z STRATEGIES.
+        difficulty: Poziom trudności: 0 - klasyczny, 1 - hradcore.
+        seed: Ziarno generatora liczb losowych.
+
+    Returns:
+        Słownik, w którym kluczem jest kategoria, a wartością lista: [gry, odgadnięte słowa, wygrane pierwszego gracza,
+        suma stanów wisielca, suma ruchów].
+
+    """
+    rng = random.Random(seed)
+    strategy = STRATEGIES[strategy_name]
+    categories = sorted(_dictionary)
+    results = {}
+    for _ in range(games):
+        category = rng.choice(categories)
+        state, turns = play_game(rng.choice(_dictionary[category]), category, difficulty, strategy, rng)
+        stats = results.setdefault(category, [0, 0, 0, 0, 0])
+        stats[0] += 1
+        stats[1] += state.letters_remaining <= 0
+        stats[2] += state.winner == 0
+        stats[3] += state.current_step
+        stats[4] += turns
+    return results
+
+
+def run_simulation(games: int, strategy_name: str = "frequency", difficulties: tuple[int, ...] = (0, 1),
+                   workers: int | None = None, seed: int = 0,
+                   dictionary: dict[str, list[str]] | None = None) -> dict[tuple[str, int], list[int]]:
+    """Rozgrywa zadaną liczbę gier dla każdego poziomu trudności, dzieląc je między procesy.
+
+    Args:
+        games: Liczba gier na każdy poziom trudności.
+        strategy_name: Nazwa strategii z STRATEGIES.
+        difficulties: Poziomy trudności do zasymulowania.
+        workers: Liczba procesów. Domyślnie liczba procesorów; 1 oznacza symulację w bieżącym procesie.
+        seed: Ziarno, z którego wyliczane są ziarna poszczególnych paczek.
+        dictionary: Słowa w podziale na kategorie. Domyślnie wczytywane z bazy danych.
+
+    Returns:
+        Słownik, w którym kluczem jest para (kategoria, poziom trudności), a wartością zagregowane wyniki
+        w formacie z simulate_chunk.
+
+    """
+    dictionary = dictionary if dictionary is not None else load_dictionary()
+    tasks = []
+    for difficulty in difficulties:
+        for start in range(0, games, CHUNK_SIZE):
+            tasks.append((min(CHUNK_SIZE, games - start), strategy_name, difficulty, seed * 1000003 + len(tasks)))
+
+    if workers == 1:
+        init_worker(dictionary)
+        chunks = [simulate_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers or os.cpu_count(), initializer=init_worker,
+                                 initargs=(dictionary,)) as executor:
+            chunks = list(executor.map(simulate_chunk, *zip(*tasks)))
+
+    results = {}
+    for (_, _, difficulty, _), chunk in zip(tasks, chunks):
+        for category, stats in chunk.items():
+            total = results.setdefault((category, difficulty), [0, 0, 0, 0, 0])
+            for i, value in enumerate(stats):
+                total[i] += value
+    return results
+
+
+def summarize(results: dict[tuple[str, int], list[int]]) -> list[dict]:
+    """Zamienia zagregowane wyniki na statystyki.
+
+    Args:
+        results: Wyniki zwrócone przez run_simulation.
+
+    Returns:
+        Lista statystyk dla każdej pary (kategoria, poziom trudności).
+
+    """
+    summary = []
+    for (category, difficulty), (games, solved, first_wins, steps, turns) in sorted(results.items()):
+        summary.append({
+            "category": category,
+            "difficulty": DIFFICULTY_NAMES.get(difficulty, str(difficulty)),
+            "games": games,
+            "solved_rate": solved / games,
+            "first_player_win_rate": first_wins / games,
+            "average_steps": steps / games,
+            "average_turns": turns / games,
+        })
+    return summary
+
+
+def main() -> None:
+    """Uruchamia symulację z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Symulacja rozgrywek wisielca.")
+    parser.add_argument("games", type=int, help="Liczba gier na każdy poziom trudności.")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency", help="Strategia zgadywania.")
+    parser.add_argument("--difficulty", type=int, nargs="+", choices=sorted(DIFFICULTY_NAMES), default=[0, 1],
+                        help="Poziomy trudności: 0 - klasyczny, 1 - hardcore.")
+    parser.add_argument("--workers", type=int, help="Liczba procesów.")
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno generatora liczb losowych.")
+    parser.add_argument("--json", help="Plik, do którego zostaną zapisane statystyki w formacie JSON.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = summarize(run_simulation(args.games, args.strategy, tuple(args.difficulty), args.workers, args.seed))
+    seconds = time.perf_counter() - start
+
+    print(f"{'Kategoria':<15}{'Tryb':<11}{'Gry':>10}{'Odgadnięte':>12}{'Wygrane 1.':>12}{'Śr. stan':>10}"
+          f"{'Śr. ruchy':>11}")
+    for row in summary:
+        print(f"{row['category']:<15}{row['difficulty']:<11}{row['games']:>10}{row['solved_rate']:>12.3f}"
+              f"{row['first_player_win_rate']:>12.3f}{row['average_steps']:>10.2f}{row['average_turns']:>11.2f}")
+    total_games = args.games * len(args.difficulty)
+    print(f"Rozegrano {total_games} gier w {seconds:.2f} s ({total_games / seconds:.0f} gier/s).")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
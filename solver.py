@@ -0,0 +1,444 @@
+"""Moduł zawiera podpowiedzi - wybór litery, która najbardziej zawęża zbiór pasujących słów.
+
+Słowa są indeksowane raz: w podziale na długość, a w każdej grupie dla każdej pary (pozycja, litera) trzymana jest
+maska bitowa słów, które mają tę literę na tej pozycji. Maski są liczbami całkowitymi Pythona, więc filtrowanie
+kandydatów to kilkadziesiąt operacji AND na całych maskach, a nie przeglądanie słów.
+
+CompiledWordIndex robi to samo na maskach zapisanych w skompilowanym słowniku (zob. compiled_dictionary) - są one
+tablicami NumPy będącymi widokami na zmapowany plik, więc otwarcie indeksu nie kopiuje ani nie dekoduje słów, a kilka
+procesów korzysta z jednej kopii masek w pamięci podręcznej systemu. Słowa są dekodowane dopiero w candidates().
+
+Przykład użycia z linii poleceń (pomiar czasu podpowiedzi na losowym słowniku)::
+
+    python solver.py --benchmark 1000000
+
+Attributes:
+    BENCHMARK_QUERIES (int): Domyślna liczba podpowiedzi mierzonych w benchmarku.
+    LETTER_INDEX (dict[str, int]): Numer litery w alfabecie gry - indeks maski w skompilowanym słowniku.
+
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import Hashable, Iterable
+
+import numpy as np
+
+import dictionary
+from game_state import ALPHABET, GameState
+
+BENCHMARK_QUERIES = 1000
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALPHABET)}
+
+_index = None
+_index_version = None
+
+
+class LengthBucket:
+    """Klasa reprezentuje zaindeksowane słowa o jednej długości.
+
+    Args:
+        length: Długość słów.
+        words: Słowa, pisane wielkimi literami.
+        categories: Kategorie słów, w tej samej kolejności.
+
+    Attributes:
+        words (list[str]): Słowa w grupie.
+        all_bits (int): Maska wszystkich słów w grupie.
+        positions (list[dict[str, int]]): Dla każdej pozycji maski słów według litery na tej pozycji.
+        letters (dict[str, int]): Maski słów zawierających daną literę na dowolnej pozycji.
+        categories (dict[Hashable, int]): Maski słów należących do danej kategorii.
+
+    """
+    __slots__ = ("words", "all_bits", "positions", "letters", "categories")
+
+    def __init__(self, length: int, words: list[str], categories: list[Hashable]) -> None:
+        self.words = words
+        self.all_bits = (1 << len(words)) - 1
+
+        codes = np.frombuffer("".join(words).encode("utf-32-le"), dtype=np.uint32).reshape(len(words), length)
+        self.positions = []
+        self.letters = dict.fromkeys(ALPHABET, 0)
+        for position in range(length):
+            column = codes[:, position]
+            position_bits = {}
+            for letter in ALPHABET:
+                bits = to_bits(column == ord(letter))
+                position_bits[letter] = bits
+                self.letters[letter] |= bits
+            self.positions.append(position_bits)
+
+        category_array = np.array(categories, dtype=object)
+        self.categories = {category: to_bits(category_array == category) for category in set(categories)}
+
+
+def to_bits(mask: np.ndarray) -> int:
+    """Zamienia wektor logiczny na maskę bitową, w której bit i odpowiada elementowi i.
+
+    Args:
+        mask: Wektor logiczny.
+
+    Returns:
+        Maska bitowa.
+
+    """
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+class WordIndex:
+    """Klasa reprezentuje indeks słów do szybkiego filtrowania kandydatów po wzorcu i podanych literach.
+
+    Args:
+        entries: Pary (kategoria, słowo). Kategoria może być dowolnym hashowalnym obiektem, np. id lub nazwą.
+
+    Attributes:
+        buckets (dict[int, LengthBucket]): Zaindeksowane słowa w podziale na długość.
+
+    """
+
+    def __init__(self, entries: Iterable[tuple[Hashable, str]]) -> None:
+        grouped = {}
+        for category, word in entries:
+            word = word.upper()
+            words, categories = grouped.setdefault(len(word), ([], []))
+            words.append(word)
+            categories.append(category)
+        self.buckets = {length: LengthBucket(length, words, categories)
+                        for length, (words, categories) in grouped.items() if length}
+
+    @classmethod
+    def from_database(cls) -> "WordIndex":
+        """Buduje indeks ze wszystkich słów w bazie danych (ze współdzielonego słownika w pamięci), z id kategorii
+        jako kategorią.
+
+        Returns:
+            Indeks słów.
+
+        """
+        return cls((category_id, word) for category_id, category in dictionary.cache.get_categories().items()
+                   for word in category.words)
+
+    def filter(self, pattern: list[str], wrong_letters: Iterable[str] = (),
+               category: Hashable | None = None) -> tuple[int, LengthBucket | None]:
+        """Wyznacza słowa pasujące do wzorca.
+
+        Args:
+            pattern: Wzorzec w postaci guessed_word_list - odkryte litery i "_" w miejscu nieodkrytych.
+            wrong_letters: Litery, których nie ma w słowie.
+            category: Kategoria słowa. Jeżeli None, brane są pod uwagę wszystkie kategorie.
+
+        Returns:
+            Maska pasujących słów oraz grupa słów o długości wzorca (None, jeżeli takiej grupy nie ma).
+
+        """
+        bucket = self.buckets.get(len(pattern))
+        if bucket is None:
+            return 0, None
+
+        bits = bucket.all_bits if category is None else bucket.categories.get(category, 0)
+        revealed = {letter for letter in pattern if letter != "_"}
+        for letter in wrong_letters:
+            if letter not in revealed:
+                bits &= ~bucket.letters.get(letter, 0)
+        for position, known in enumerate(pattern):
+            position_bits = bucket.positions[position]
+            if known != "_":
+                bits &= position_bits.get(known, 0)
+            else:
+                # Odkryta litera pojawia się na wszystkich swoich pozycjach, więc nie może stać pod "_".
+                for letter in revealed:
+                    bits &= ~position_bits[letter]
+        return bits, bucket
+
+    def candidates(self, pattern: list[str], wrong_letters: Iterable[str] = (),
+                   category: Hashable | None = None) -> list[str]:
+        """Zwraca słowa pasujące do wzorca.
+
+        Args:
+            pattern: Wzorzec w postaci guessed_word_list.
+            wrong_letters: Litery, których nie ma w słowie.
+            category: Kategoria słowa. Jeżeli None, brane są pod uwagę wszystkie kategorie.
+
+        Returns:
+            Lista pasujących słów.
+
+        """
+        bits, bucket = self.filter(pattern, wrong_letters, category)
+        if bucket is None:
+            return []
+        return [word for i, word in enumerate(bucket.words) if bits >> i & 1]
+
+    def best_letter(self, pattern: list[str], wrong_letters: Iterable[str] = (),
+                    category: Hashable | None = None) -> str | None:
+        """Wybiera literę, która najbardziej zawęża zbiór pasujących słów.
+
+        Dla każdej niepodanej litery liczona jest oczekiwana liczba kandydatów po strzale, (k² + (n - k)²) / n,
+        gdzie n to liczba kandydatów, a k to liczba kandydatów zawierających literę. Przy remisie wygrywa litera
+        występująca w większej liczbie kandydatów.
+
+        Args:
+            pattern: Wzorzec w postaci guessed_word_list.
+            wrong_letters: Litery, których nie ma w słowie.
+            category: Kategoria słowa. Jeżeli None, brane są pod uwagę wszystkie kategorie.
+
+        Returns:
+            Wybrana litera albo None, jeżeli żadne słowo nie pasuje do wzorca.
+
+        """
+        wrong_letters = set(wrong_letters)
+        bits, bucket = self.filter(pattern, wrong_letters, category)
+        count = bits.bit_count()
+        if count == 0:
+            return None
+
+        best_letter = None
+        best_key = None
+        for letter in ALPHABET:
+            if letter in wrong_letters or letter in pattern:
+                continue
+            hits = (bits & bucket.letters[letter]).bit_count()
+            if hits == 0:
+                continue
+            key = (hits * hits + (count - hits) * (count - hits), -hits)
+            if best_key is None or key < best_key:
+                best_letter, best_key = letter, key
+        return best_letter
+
+
+class CompiledWordIndex:
+    """Klasa reprezentuje indeks słów skompilowanego słownika, z id kategorii jako kategorią.
+
+    Ma ten sam interfejs co WordIndex, ale maski są tablicami uint8 (bit i bajtu j odpowiada słowu 8 * j + i grupy)
+    czytanymi bezpośrednio ze zmapowanego pliku. Indeks nie zamyka słownika - robi to jego właściciel lub close().
+
+    Args:
+        compiled: Otwarty skompilowany słownik.
+
+    Attributes:
+        compiled (compiled_dictionary.CompiledDictionary): Słownik, z którego pochodzą maski.
+
+    """
+
+    def __init__(self, compiled) -> None:
+        self.compiled = compiled
+
+    @classmethod
+    def open(cls, path: str) -> "CompiledWordIndex":
+        """Otwiera skompilowany słownik i tworzy na nim indeks.
+
+        Args:
+            path: Ścieżka do pliku skompilowanego słownika.
+
+        Returns:
+            Indeks słów.
+
+        """
+        from compiled_dictionary import CompiledDictionary
+
+        return cls(CompiledDictionary(path))
+
+    def close(self) -> None:
+        """Zamyka skompilowany słownik."""
+        self.compiled.close()
+
+    def __enter__(self) -> "CompiledWordIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def filter(self, pattern: list[str], wrong_letters: Iterable[str] = (),
+               category: int | None = None) -> tuple[np.ndarray, "compiled_dictionary.LengthGroup | None"]:
+        """Wyznacza słowa pasujące do wzorca.
+
+        Args:
+            pattern: Wzorzec w postaci guessed_word_list - odkryte litery i "_" w miejscu nieodkrytych.
+            wrong_letters: Litery, których nie ma w słowie.
+            category: Id kategorii słowa. Jeżeli None, brane są pod uwagę wszystkie kategorie.
+
+        Returns:
+            Maska pasujących słów (nowa tablica uint8) oraz grupa słów o długości wzorca (None, jeżeli takiej grupy
+            nie ma).
+
+        """
+        group = self.compiled.length_groups.get(len(pattern))
+        if group is None:
+            return np.zeros(0, dtype=np.uint8), None
+
+        count = len(group.indices)
+        if category is None:
+            selected = np.ones(count, dtype=bool)
+        else:
+            # Słowa kategorii zajmują ciągły przedział indeksów, a indeksy w grupie są rosnące.
+            selected = np.zeros(count, dtype=bool)
+            category_range = self.compiled.categories.get(category)
+            if category_range is not None:
+                start, end = np.searchsorted(group.indices, [category_range.start, category_range.end])
+                selected[start:end] = True
+        bits = np.packbits(selected, bitorder="little")
+
+        revealed = {letter for letter in pattern if letter != "_"}
+        for letter in wrong_letters:
+            if letter not in revealed and letter in LETTER_INDEX:
+                bits &= ~group.letters[LETTER_INDEX[letter]]
+        for position, known in enumerate(pattern):
+            position_bits = group.positions[position]
+            if known != "_":
+                if known not in LETTER_INDEX:
+                    bits[:] = 0
+                    break
+                bits &= position_bits[LETTER_INDEX[known]]
+            else:
+                # Odkryta litera pojawia się na wszystkich swoich pozycjach, więc nie może stać pod "_".
+                for letter in revealed:
+                    if letter in LETTER_INDEX:
+                        bits &= ~position_bits[LETTER_INDEX[letter]]
+        return bits, group
+
+    def candidates(self, pattern: list[str], wrong_letters: Iterable[str] = (),
+                   category: int | None = None) -> list[str]:
+        """Zwraca słowa pasujące do wzorca.
+
+        Args:
+            pattern: Wzorzec w postaci guessed_word_list.
+            wrong_letters: Litery, których nie ma w słowie.
+            category: Id kategorii słowa. Jeżeli None, brane są pod uwagę wszystkie kategorie.
+
+        Returns:
+            Lista pasujących słów, pisanych wielkimi literami.
+
+        """
+        bits, group = self.filter(pattern, wrong_letters, category)
+        if group is None:
+            return []
+        selected = np.unpackbits(bits, count=len(group.indices), bitorder="little").nonzero()[0]
+        return [self.compiled.word(int(index)).upper() for index in group.indices[selected]]
+
+    def best_letter(self, pattern: list[str], wrong_letters: Iterable[str] = (),
+                    category: int | None = None) -> str | None:
+        """Wybiera literę, która najbardziej zawęża zbiór pasujących słów - tak samo jak WordIndex.best_letter.
+
+        Args:
+            pattern: Wzorzec w postaci guessed_word_list.
+            wrong_letters: Litery, których nie ma w słowie.
+            category: Id kategorii słowa. Jeżeli None, brane są pod uwagę wszystkie kategorie.
+
+        Returns:
+            Wybrana litera albo None, jeżeli żadne słowo nie pasuje do wzorca.
+
+        """
+        wrong_letters = set(wrong_letters)
+        bits, group = self.filter(pattern, wrong_letters, category)
+        count = int(np.bitwise_count(bits).sum())
+        if count == 0:
+            return None
+
+        best_letter = None
+        best_key = None
+        scratch = np.empty_like(bits)
+        for letter in ALPHABET:
+            if letter in wrong_letters or letter in pattern:
+                continue
+            np.bitwise_and(bits, group.letters[LETTER_INDEX[letter]], out=scratch)
+            hits = int(np.bitwise_count(scratch).sum())
+            if hits == 0:
+                continue
+            key = (hits * hits + (count - hits) * (count - hits), -hits)
+            if best_key is None or key < best_key:
+                best_letter, best_key = letter, key
+        return best_letter
+
+
+def get_index() -> WordIndex:
+    """Zwraca współdzielony indeks wszystkich słów z bazy danych.
+
+    Indeks jest budowany przy pierwszym wywołaniu i przebudowywany, gdy zmieni się wersja słownika w pamięci
+    (dictionary.cache), np. po imporcie słów w tym lub innym procesie.
+
+    Returns:
+        Indeks słów.
+
+    """
+    global _index, _index_version
+    dictionary.cache.refresh()
+    if _index is None or _index_version != dictionary.cache.version:
+        _index = WordIndex.from_database()
+        _index_version = dictionary.cache.version
+    return _index
+
+
+def clear_index() -> None:
+    """Usuwa współdzielony indeks, wymuszając jego przebudowanie przy następnym wywołaniu get_index."""
+    global _index
+    _index = None
+
+
+def hint(state: GameState, category_id: int | None = None) -> str | None:
+    """Podpowiada literę dla trwającej rozgrywki.
+
+    Args:
+        state: Stan rozgrywki, np. Game.state.
+        category_id: Id kategorii zgadywanego słowa, np. Game.category.id.
+
+    Returns:
+        Podpowiadana litera albo None, jeżeli żadne słowo nie pasuje do wzorca.
+
+    """
+    return get_index().best_letter(state.guessed_word_list, state.wrong_letters, category_id)
+
+
+def benchmark(word_count: int, queries: int = BENCHMARK_QUERIES, seed: int = 0) -> dict[str, float]:
+    """Mierzy czas budowy indeksu i czas podpowiedzi na losowym słowniku.
+
+    Args:
+        word_count: Liczba słów w słowniku.
+        queries: Liczba mierzonych podpowiedzi.
+        seed: Ziarno generatora liczb losowych.
+
+    Returns:
+        Czas budowy indeksu w sekundach oraz średni i percentylowe czasy podpowiedzi w milisekundach.
+
+    """
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(ALPHABET, k=rng.randint(4, 12))) for _ in range(word_count)]
+
+    start = time.perf_counter()
+    index = WordIndex((i % 10, word) for i, word in enumerate(words))
+    build_seconds = time.perf_counter() - start
+
+    timings = []
+    for _ in range(queries):
+        state = GameState(rng.choice(words))
+        for letter in rng.sample(ALPHABET, rng.randint(0, 8)):
+            state.check_letter(letter)
+        start = time.perf_counter()
+        index.best_letter(state.guessed_word_list, state.wrong_letters)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    percentiles = statistics.quantiles(timings, n=100)
+    return {
+        "words": word_count,
+        "build_seconds": build_seconds,
+        "mean_ms": statistics.fmean(timings),
+        "p50_ms": percentiles[49],
+        "p99_ms": percentiles[98],
+    }
+
+
+def main() -> None:
+    """Uruchamia benchmark podpowiedzi z linii poleceń."""
+    parser = argparse.ArgumentParser(description="Podpowiedzi liter dla wisielca.")
+    parser.add_argument("--benchmark", type=int, metavar="WORDS", required=True,
+                        help="Zmierz czas podpowiedzi na losowym słowniku o podanej liczbie słów.")
+    parser.add_argument("--queries", type=int, default=BENCHMARK_QUERIES, help="Liczba mierzonych podpowiedzi.")
+    args = parser.parse_args()
+
+    result = benchmark(args.benchmark, args.queries)
+    print(f"Indeks {result['words']} słów zbudowany w {result['build_seconds']:.2f} s.")
+    print(f"Podpowiedź: średnio {result['mean_ms']:.3f} ms, p50 {result['p50_ms']:.3f} ms, "
+          f"p99 {result['p99_ms']:.3f} ms.")
+
+
+if __name__ == "__main__":
+    main()
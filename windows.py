@@ -5,21 +5,21 @@ Attributes:
     HEIGHT (int): Wysokość okna gry.
     BG_COLOR (str): Kolor tła w formacie heksadecymanym.
     BG_CBUTTON_COLOR OLOR (str): Kolor tła w formacie heksadecymanym.
-    Base: Klasa będąca reprezentacją bazy deklaratywnej.
-    engine (sqlalchemy.engine.Engine): Silnik bazy danych, łączący się z nią przez connection stringa.
-    Session: Klasa reprezentująca sesję połączenia z bazą danych.
+    POLL_INTERVAL (int): Co ile milisekund okna sprawdzają, czy operacja z puli wątków się zakończyła.
+    LOAD_THRESHOLD (float): Przewinięcie tabeli statystyk (0 - 1), od którego wczytywana jest następna strona.
+
+Moduł importuje na starcie tylko tkinter - moduły bazy danych, uwierzytelniania i gry (SQLAlchemy, bcrypt, pygame)
+są importowane dopiero przy pierwszym użyciu, żeby menu główne pojawiało się jak najszybciej.
 
 """
-import csv
 import tkinter as tk
 import tkinter.messagebox as messagebox
+from concurrent.futures import Future
 from tkinter import ttk, filedialog
-import bcrypt
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker, declarative_base
-import db_initialize
-from db_initialize import Player
-from game import Game
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from db_initialize import Player
 
 WIDTH = 1960
 HEIGHT = 1080
@@ -27,58 +27,54 @@ BG_COLOR = "#13a18b"
 BUTTON_COLOR = "#64a18b"
 BUTTON_FONT = ("Comic sans MS", 10)
 FORM_BUTTON_FONT = ("Comic sans MS", 30)
+POLL_INTERVAL = 20
+LOAD_THRESHOLD = 0.9
 
-Base = declarative_base()
-engine = create_engine("sqlite:///database.db", echo=True)
-Session = sessionmaker(bind=engine)
 
+def wait_for(window: tk.Misc, future: Future, callback: Callable[[Any], None],
+             on_error: Callable[[Exception], None] | None = None) -> None:
+    """Czeka na wynik operacji z puli wątków bez blokowania pętli Tk, a następnie przekazuje go do callback.
 
-def hash_password(password: str) -> str:
-    """Funkcja hashuje hasło.
+    Jeżeli operacja zakończyła się wyjątkiem, wyświetlany jest komunikat o błędzie i wywoływana jest funkcja
+    on_error, np. przywracająca przyciski.
 
     Args:
-        password: Hasło do shashowania.
-
-    Returns:
-        Shashowane hasło.
+        window: Okno, którego pętla zdarzeń sprawdza wynik.
+        future: Wynik operacji z puli wątków.
+        callback: Funkcja wywoływana z wynikiem operacji w wątku Tk.
+        on_error: Funkcja wywoływana z wyjątkiem w wątku Tk, jeżeli operacja się nie powiodła.
 
     """
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-
-
-def verify_password(password: str, hashed_password: str) -> bool:
-    """Sprawdza czy zwykłe hasło zgadza się z tym shashowanym.
-
-    Args:
-        password: Zwykłe hasło.
-        hashed_password: Shashowane hasło.
-
-    Returns:
-        Prawda, jeżeli hasła się zgadzają. Fałsz w przeciwnym przypadku
-
-    """
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-
-
-Base.metadata.create_all(bind=engine)
+    if not future.done():
+        window.after(POLL_INTERVAL, wait_for, window, future, callback, on_error)
+        return
+    try:
+        result = future.result()
+    except Exception as error:
+        messagebox.showerror("Błąd", f"Operacja nie powiodła się: {error}")
+        if on_error is not None:
+            on_error(error)
+        return
+    callback(result)
 
 
 class StartWindow(tk.Tk):
     """Klasa reprezentuje ekran startowy aplikacji - memu główne.
 
     Attributes:
-        session (sqlalchemy.orm.Session): Sesja połączenia do bazy danych.
+        session (sqlalchemy.orm.Session | None): Sesja połączenia do bazy danych; None do czasu wywołania
+            initialize_database().
         logged_players (list[Player]): Lista zalogowanych graczy.
         difficulty (int): Poziom trudności: 0 - klasyczny, 1 - hradcore.
+        event_driven (bool): Prawda, jeżeli gra ma używać pętli sterowanej zdarzeniami zamiast odświeżania co klatkę.
 
     """
 
     def __init__(self) -> None:
         super().__init__()
-        self.session = Session()
+        self.session = None
         self.title("Wisielec")
 
-        db_initialize.db_initialize()
         window_width = 800
         window_height = 400
         x = (WIDTH - window_width) // 2
@@ -91,6 +87,7 @@ class StartWindow(tk.Tk):
         self.logged_players = []
 
         self.difficulty = 0
+        self.event_driven = True
 
         game_title = tk.Label(self, text="WISIELEC", font=("Comic sans MS", 50), pady=30, bg=BG_COLOR)
         game_title.pack()
@@ -120,12 +117,26 @@ class StartWindow(tk.Tk):
                                     bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
         exit_app_button.pack(side=tk.LEFT, padx=10)
 
+    def initialize_database(self) -> None:
+        """Importuje moduły bazy danych, inicjalizuje bazę i otwiera sesję.
+
+        Wywoływane po wyświetleniu menu, żeby import SQLAlchemy nie opóźniał pojawienia się okna.
+        """
+        import db_initialize
+        from database import Session
+
+        db_initialize.db_initialize()
+        self.session = Session()
+
     def start_game(self) -> None:
         """Odpala grę."""
+        from game import Game
+
         if len(self.logged_players) >= 2:
             self.withdraw()
             game = Game(self.session.merge(self.logged_players[0]), self.session.merge(self.logged_players[1]))
             game.difficulty = self.difficulty
+            game.event_driven = self.event_driven
             game.run()
             self.deiconify()
         else:
@@ -192,24 +203,34 @@ class RegisterWindow(tk.Tk):
         password_entry = tk.Entry(self, show="*")
         password_entry.place(x=200, y=400, width=200, height=30)
 
-        confirm_button = tk.Button(self, text="ZAREJESTRUJ", font=BUTTON_FONT,
-                                   command=lambda: self.add_to_db(nickname_entry.get(), password_entry.get()), width=12,
-                                   height=1, bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
-        confirm_button.place(x=250, y=500)
+        self.confirm_button = tk.Button(self, text="ZAREJESTRUJ", font=BUTTON_FONT,
+                                        command=lambda: self.add_to_db(nickname_entry.get(), password_entry.get()),
+                                        width=12, height=1, bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
+        self.confirm_button.place(x=250, y=500)
 
     def add_to_db(self, nickname: str, password: str) -> None:
-        """Dodaje gracza do bazy danych.
+        """Rejestruje gracza w puli wątków - hashuje hasło i dodaje gracza do bazy danych.
 
         Args:
             nickname: Pseudonim gracza.
             password: Hasło gracza.
         """
-        session = Session()
-        max_id = session.query(func.max(Player.id_player)).scalar()
-        max_id = max_id or 0
-        max_id = int(max_id)
-        session.add(Player(max_id + 1, nickname, hash_password(password)))
-        session.commit()
+        from auth import auth_service
+
+        self.confirm_button.config(state=tk.DISABLED)
+        wait_for(self, auth_service.register(nickname, password), self.finish_registration,
+                 lambda error: self.confirm_button.config(state=tk.NORMAL))
+
+    def finish_registration(self, player: "Player | None") -> None:
+        """Kończy rejestrację gracza.
+
+        Args:
+            player: Zarejestrowany gracz albo None, jeżeli pseudonim jest zajęty.
+        """
+        if player is None:
+            self.confirm_button.config(state=tk.NORMAL)
+            messagebox.showinfo("Rejestracja", "Pseudonim jest już zajęty!")
+            return
         self.destroy()
         messagebox.showinfo("Rejestracja", "Zarejestrowano pomyślnie!")
 
@@ -249,33 +270,51 @@ class LoginWindow(tk.Tk):
         password_entry = tk.Entry(self, show="*")
         password_entry.place(x=200, y=400, width=200, height=30)
 
-        confirm_button = tk.Button(self, text="ZALOGUJ", font=BUTTON_FONT,
-                                   command=lambda: self.check_in_db(nickname_entry.get(), password_entry.get(), master),
-                                   width=12, height=1, bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
-        confirm_button.place(x=250, y=500)
+        self.confirm_button = tk.Button(self, text="ZALOGUJ", font=BUTTON_FONT,
+                                        command=lambda: self.check_in_db(nickname_entry.get(), password_entry.get(),
+                                                                         master),
+                                        width=12, height=1, bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
+        self.confirm_button.place(x=250, y=500)
 
     def check_in_db(self, nickname: str, password: str, master: StartWindow) -> None:
-        """Sprawdza czy gracz o podanych danych znajduje się w bazie.
+        """Sprawdza w puli wątków czy gracz o podanych danych znajduje się w bazie.
 
         Args:
             nickname: Pseudonim gracza.
             password: Hasło gracza.
             master: Nadrzędne okno główne.
         """
-        session = Session()
-        player = session.query(Player).filter_by(nickname=nickname).first()
-        if player and verify_password(password, player.password):
-            self.destroy()
+        from auth import auth_service
+
+        self.confirm_button.config(state=tk.DISABLED)
+        wait_for(self, auth_service.login(nickname, password), lambda player: self.finish_login(player, master),
+                 lambda error: self.confirm_button.config(state=tk.NORMAL))
+
+    def finish_login(self, player: "Player | None", master: StartWindow) -> None:
+        """Kończy logowanie po sprawdzeniu danych gracza.
+
+        Args:
+            player: Zalogowany gracz albo None, jeżeli dane są błędne.
+            master: Nadrzędne okno główne.
+        """
+        self.destroy()
+        if player:
             master.logged_players.append(player)
             messagebox.showinfo("Logowanie", "Zalogowano pomyślnie!")
         else:
-            self.destroy()
             messagebox.showinfo("Logowanie", "Błędny login lub hasło!")
-        session.commit()
 
 
 class StatsWindow(tk.Tk):
-    """Klasa reprezentuje ekran statystyk graczy."""
+    """Klasa reprezentuje ekran statystyk graczy - ranking wczytywany stronami podczas przewijania.
+
+    Attributes:
+        leaderboard (Leaderboard): Aktualnie przeglądany ranking.
+        tree (ttk.Treeview): Tabela z rankingiem.
+        scrollbar (ttk.Scrollbar): Pasek przewijania tabeli.
+        search_entry (tk.Entry): Pole wyszukiwania po pseudonimie.
+
+    """
 
     def __init__(self) -> None:
         super().__init__()
@@ -290,30 +329,39 @@ class StatsWindow(tk.Tk):
         self.resizable(False, False)
         self.config(bg=BG_COLOR)
 
-        session = Session()
-        self.players = session.query(Player).all()
-        self.players = sorted(self.players, key=lambda player: player.id_player)
-        session.close()
-
-        title_label = tk.Label(self, text="Statystyki graczy", font=("Comic sans MS", 20), pady=30, bg=BG_COLOR)
+        title_label = tk.Label(self, text="Statystyki graczy", font=("Comic sans MS", 20), pady=20, bg=BG_COLOR)
         title_label.pack()
 
-        tree = ttk.Treeview(self, height=20)
-        tree["columns"] = ("Nickname", "BestScore")
-        tree.heading("#0", text="ID")
-        tree.heading("Nickname", text="Nazwa użytkownika")
-        tree.heading("BestScore", text="Wynik")
-
-        tree.column("#0", width=50, minwidth=50, anchor=tk.CENTER)
-        tree.column("Nickname", width=300, minwidth=300, anchor=tk.CENTER)
-        tree.column("BestScore", width=50, minwidth=50, anchor=tk.CENTER)
-
-        i = 1
-        for player in self.players:
-            tree.insert("", "end", text=f"{i}", values=(player.nickname, player.best_score))
-            i += 1
-
-        tree.pack(padx=50)
+        search_frame = tk.Frame(self, bg=BG_COLOR)
+        search_frame.pack(pady=5)
+        self.search_entry = tk.Entry(search_frame, width=30)
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<Return>", lambda event: self.search())
+        search_button = tk.Button(search_frame, text="SZUKAJ", font=BUTTON_FONT, command=self.search, width=8,
+                                  height=1, bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
+        search_button.pack(side=tk.LEFT)
+
+        tree_frame = tk.Frame(self, bg=BG_COLOR)
+        tree_frame.pack(padx=50)
+        self.tree = ttk.Treeview(tree_frame, height=18)
+        self.tree["columns"] = ("Nickname", "BestScore")
+        self.tree.heading("#0", text="Miejsce")
+        self.tree.heading("Nickname", text="Nazwa użytkownika")
+        self.tree.heading("BestScore", text="Wynik")
+
+        self.tree.column("#0", width=60, minwidth=60, anchor=tk.CENTER)
+        self.tree.column("Nickname", width=290, minwidth=290, anchor=tk.CENTER)
+        self.tree.column("BestScore", width=50, minwidth=50, anchor=tk.CENTER)
+
+        self.scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.config(yscrollcommand=self.on_scroll)
+        self.tree.pack(side=tk.LEFT)
+        self.scrollbar.pack(side=tk.LEFT, fill=tk.Y)
+
+        from leaderboard import Leaderboard
+
+        self.leaderboard = Leaderboard()
+        self.load_page()
 
         export_button = tk.Button(self, text="EKSPORTUJ", font=BUTTON_FONT, command=self.export, width=12, height=1,
                                   bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
@@ -323,18 +371,60 @@ class StatsWindow(tk.Tk):
                                    bg=BUTTON_COLOR, activebackground=BUTTON_COLOR)
         go_back_button.place(x=350, y=600)
 
+    def load_page(self) -> None:
+        """Dopisuje do tabeli następną stronę rankingu."""
+        for entry in self.leaderboard.next_page():
+            self.tree.insert("", "end", text=f"{entry.rank}", values=(entry.nickname, entry.best_score))
+
+    def on_scroll(self, first: str, last: str) -> None:
+        """Aktualizuje pasek przewijania i wczytuje następną stronę, gdy tabela jest przewinięta blisko końca.
+
+        Args:
+            first: Początek widocznego fragmentu tabeli (0 - 1).
+            last: Koniec widocznego fragmentu tabeli (0 - 1).
+
+        """
+        self.scrollbar.set(first, last)
+        if float(last) >= LOAD_THRESHOLD and not self.leaderboard.exhausted:
+            self.load_page()
+
+    def search(self) -> None:
+        """Wyświetla od początku ranking graczy, których pseudonim zawiera wpisany tekst."""
+        from leaderboard import Leaderboard
+
+        self.tree.delete(*self.tree.get_children())
+        self.leaderboard = Leaderboard(self.search_entry.get().strip())
+        self.load_page()
+
     def export(self) -> None:
-        """Eksportuje dane graczy do pliku .csv."""
-        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV Files", "*.csv")])
+        """Eksportuje statystyki wszystkich graczy do pliku .csv, .jsonl lub .parquet."""
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                 filetypes=[("CSV Files", "*.csv"), ("JSON Lines Files", "*.jsonl"),
+                                                            ("Parquet Files", "*.parquet")])
         if not file_path:
             return
-        with open(file_path, mode="w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(["IdPlayer", "Nickname", "BestScore"])
-            for player in self.players:
-                writer.writerow([player.id_player, player.nickname, player.best_score])
+        from export import export_players
+
+        try:
+            export_players(file_path, progress=self.show_export_progress)
+        except ImportError as error:
+            messagebox.showinfo("Błąd", str(error))
+            return
+        finally:
+            self.title("Rejestracja")
         messagebox.showinfo("Sukces", "Importowanie zakończone sukcesem!")
 
+    def show_export_progress(self, exported: int, total: int) -> None:
+        """Wyświetla postęp eksportu w tytule okna.
+
+        Args:
+            exported: Liczba wyeksportowanych dotąd graczy.
+            total: Liczba wszystkich graczy.
+
+        """
+        self.title(f"Eksport: {exported}/{total}")
+        self.update_idletasks()
+
 
 class OptionsWindow(tk.Tk):
     """Klasa reprezentuje ekran opcji.
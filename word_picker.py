@@ -0,0 +1,98 @@
+"""Moduł zawiera klasę losującą kategorię i słowo w czasie stałym, ze słownika trzymanego w pamięci.
+
+Attributes:
+    picker (WordPicker): Współdzielony w procesie obiekt losujący słowa.
+
+"""
+import random
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+import dictionary
+from dictionary import DictionaryCache
+
+
+class PickedWord(NamedTuple):
+    """Wylosowane słowo.
+
+    Attributes:
+        category_id (int): Identyfikator kategorii.
+        category (str): Nazwa kategorii.
+        word_id (int): Identyfikator słowa.
+        word (str): Słowo.
+
+    """
+    category_id: int
+    category: str
+    word_id: int
+    word: str
+
+
+class WordPicker:
+    """Klasa losuje kategorię, a następnie słowo z tej kategorii, korzystając ze słownika w pamięci (DictionaryCache).
+
+    Słowa w każdej kategorii są posortowane według trudności, więc losowanie słowa z przedziału trudności wymaga
+    tylko wyszukiwania binarnego. Losowanie nie odwołuje się do bazy danych, poza okresowym sprawdzeniem wersji
+    słownika.
+
+    Args:
+        rng: Generator liczb losowych. Domyślnie nowy random.Random().
+        cache: Słownik w pamięci. Domyślnie współdzielony dictionary.cache.
+
+    Attributes:
+        rng (random.Random): Generator liczb losowych.
+        cache (DictionaryCache): Słownik w pamięci.
+
+    """
+
+    def __init__(self, rng: random.Random | None = None, cache: DictionaryCache | None = None) -> None:
+        self.rng = rng or random.Random()
+        self.cache = cache or dictionary.cache
+
+    def invalidate(self) -> None:
+        """Wymusza ponowne wczytanie słownika przy następnym losowaniu."""
+        self.cache.invalidate()
+
+    def pick_word(self, min_difficulty: float | None = None, max_difficulty: float | None = None) -> PickedWord:
+        """Losuje kategorię, a następnie słowo z tej kategorii.
+
+        Każda kategoria mająca słowa jest wybierana z tym samym prawdopodobieństwem, a słowo jest wybierane
+        jednostajnie spośród słów tej kategorii. Jeżeli podano przedział trudności, brane są pod uwagę tylko słowa
+        z wyliczoną trudnością z tego przedziału.
+
+        Args:
+            min_difficulty: Minimalna trudność słowa.
+            max_difficulty: Maksymalna trudność słowa.
+
+        Returns:
+            Wylosowane słowo.
+
+        Raises:
+            LookupError: Jeżeli w słowniku nie ma żadnego pasującego słowa.
+
+        """
+        categories = self.cache.get_categories()
+        if min_difficulty is None and max_difficulty is None:
+            if not self.cache.category_ids:
+                raise LookupError("Brak słów w bazie danych.")
+            category_id = self.rng.choice(self.cache.category_ids)
+            index = self.rng.randrange(len(categories[category_id].ids))
+        else:
+            low = float("-inf") if min_difficulty is None else min_difficulty
+            high = float("inf") if max_difficulty is None else max_difficulty
+            ranges = {}
+            for category_id in self.cache.category_ids:
+                difficulties = categories[category_id].difficulties
+                start, end = bisect_left(difficulties, low), bisect_right(difficulties, high)
+                if start < end:
+                    ranges[category_id] = (start, end)
+            if not ranges:
+                raise LookupError("Brak słów o podanej trudności w bazie danych.")
+            category_id = self.rng.choice(list(ranges))
+            index = self.rng.randrange(*ranges[category_id])
+
+        category = categories[category_id]
+        return PickedWord(category_id, category.name, category.ids[index], category.words[index])
+
+
+picker = WordPicker()